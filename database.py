@@ -38,14 +38,36 @@ class Database:
                 date_found  TEXT DEFAULT (datetime('now', '+8 hours'))
             );
 
+            CREATE TABLE IF NOT EXISTS bot_state (
+                key         TEXT PRIMARY KEY,
+                value       TEXT
+            );
+
             CREATE INDEX IF NOT EXISTS idx_jobs_date     ON jobs(date_found DESC);
             CREATE INDEX IF NOT EXISTS idx_jobs_category ON jobs(category);
             CREATE INDEX IF NOT EXISTS idx_jobs_source   ON jobs(source);
             CREATE INDEX IF NOT EXISTS idx_users_sub     ON users(subscribed);
+            CREATE INDEX IF NOT EXISTS idx_users_filter_sub ON users(filters) WHERE subscribed = 1;
         """)
         conn.commit()
         conn.close()
 
+    def get_state(self, key: str) -> Optional[str]:
+        conn = self.get_conn()
+        row = conn.execute("SELECT value FROM bot_state WHERE key = ?", (key,)).fetchone()
+        conn.close()
+        return row["value"] if row else None
+
+    def set_state(self, key: str, value: str):
+        conn = self.get_conn()
+        conn.execute(
+            "INSERT INTO bot_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+        conn.commit()
+        conn.close()
+
     def add_user(self, user_id: int, name: str) -> bool:
         conn = self.get_conn()
         cursor = conn.execute(
@@ -75,6 +97,16 @@ class Database:
         conn.commit()
         conn.close()
 
+    def bulk_unsubscribe(self, user_ids):
+        """Unsubscribe many users (e.g. everyone who blocked the bot) in one commit."""
+        conn = self.get_conn()
+        conn.executemany(
+            "UPDATE users SET subscribed = 0 WHERE user_id = ?",
+            [(user_id,) for user_id in user_ids],
+        )
+        conn.commit()
+        conn.close()
+
     def set_filter(self, user_id: int, filter_value: str):
         conn = self.get_conn()
         conn.execute("UPDATE users SET filters = ? WHERE user_id = ?", (filter_value, user_id))
@@ -87,6 +119,14 @@ class Database:
         conn.close()
         return [dict(r) for r in rows]
 
+    def get_subscribers_by_filter(self, filter_value: str) -> List[Dict]:
+        conn = self.get_conn()
+        rows = conn.execute(
+            "SELECT * FROM users WHERE subscribed = 1 AND filters = ?", (filter_value,)
+        ).fetchall()
+        conn.close()
+        return [dict(r) for r in rows]
+
     def count_users(self) -> int:
         conn = self.get_conn()
         n = conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
@@ -121,6 +161,34 @@ class Database:
         finally:
             conn.close()
 
+    def save_jobs_bulk(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Insert a whole scrape batch in one transaction (one commit instead of
+        one per job) and return only the jobs that were actually new.
+        """
+        conn = self.get_conn()
+        saved = []
+        try:
+            with conn:
+                for job in jobs:
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO jobs (title, company, link, category, location, salary, source) VALUES (?,?,?,?,?,?,?)",
+                        (
+                            job.get("title", ""),
+                            job.get("company", ""),
+                            job.get("link", ""),
+                            job.get("category", "General"),
+                            job.get("location", "Philippines"),
+                            job.get("salary"),
+                            job.get("source", ""),
+                        ),
+                    )
+                    if cursor.rowcount > 0:
+                        saved.append(job)
+        finally:
+            conn.close()
+        return saved
+
     def get_latest_jobs(self, limit: int = 15) -> List[Dict]:
         conn = self.get_conn()
         rows = conn.execute("SELECT * FROM jobs ORDER BY date_found DESC LIMIT ?", (limit,)).fetchall()
@@ -149,6 +217,23 @@ class Database:
         conn.close()
         return n
 
+    def get_stats(self) -> Dict:
+        """All /stats counters in a single round-trip."""
+        conn = self.get_conn()
+        today = date.today().isoformat()
+        row = conn.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM users)                        AS total_users,
+                (SELECT COUNT(*) FROM users WHERE subscribed = 1)   AS subscribed,
+                (SELECT COUNT(*) FROM jobs)                         AS total_jobs,
+                (SELECT COUNT(*) FROM jobs WHERE date_found LIKE ?) AS jobs_today
+            """,
+            (f"{today}%",),
+        ).fetchone()
+        conn.close()
+        return dict(row)
+
     def count_by_source(self) -> List[Dict]:
         conn = self.get_conn()
         rows = conn.execute(
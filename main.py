@@ -1,7 +1,10 @@
 import asyncio
 import logging
 import os
-from datetime import datetime
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta
 
 from telegram import (
     Update,
@@ -10,6 +13,8 @@ from telegram import (
     ReplyKeyboardMarkup,
     KeyboardButton,
 )
+from telegram.error import BadRequest, Forbidden
+from telegram.helpers import escape_markdown
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -19,6 +24,7 @@ from telegram.ext import (
     filters,
 )
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from aiolimiter import AsyncLimiter
 
 from database import Database
 from scraper import JobScraper
@@ -41,6 +47,30 @@ GROUP_CHAT_ID          = os.environ.get("GROUP_CHAT_ID", "")
 db      = Database()
 scraper = JobScraper()
 
+# ─── Rate limits ───────────────────────────────────────────────────────────────
+# Telegram allows ~30 msg/s globally, 1 msg/s per private chat and
+# 20 msg/min per group — stay slightly under the global ceiling.
+SEND_LIMITER   = AsyncLimiter(28, 1.0)
+
+# Per-chat limiters, least recently used first (bounded LRU)
+CHAT_LIMITERS_MAX = 10_000
+_chat_limiters    = OrderedDict()
+
+# ─── Stats cache ───────────────────────────────────────────────────────────────
+STATS_TTL_SECONDS = 30
+_stats_cache      = {"ts": 0.0, "val": None}
+_stats_lock       = asyncio.Lock()
+
+# Identical button taps from the same user within this window are ignored
+CALLBACK_DEBOUNCE_SECONDS = 1.5
+
+# Users already registered in the DB by this process (bounded LRU)
+KNOWN_USERS_MAX = 100_000
+_known_users    = OrderedDict()
+
+# Only one scrape + broadcast cycle may run at a time (scheduler or /scrapnow)
+_broadcast_lock = asyncio.Lock()
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  CONSTANTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -79,6 +109,9 @@ SOURCE_ICONS = {
     "Telegram PH Jobs":"✈️",
 }
 
+TELEGRAM_MAX_MESSAGE_LEN = 4096
+JOB_SEPARATOR            = "\n\n━━━━━━━━━━━━━━━━━━━━━━\n\n"
+
 # Bottom reply keyboard button labels
 BTN_HELP    = "❓ Help"
 BTN_PRIVACY = "📋 Terms & Privacy"
@@ -92,41 +125,64 @@ BTN_FILTER  = "⚙️ Job Filter"
 #  KEYBOARDS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def bottom_keyboard():
-    """
-    Persistent keyboard at the bottom of the chat.
-    Only visible in private/direct messages — never shown in group posts.
-    """
-    return ReplyKeyboardMarkup(
-        [
-            [KeyboardButton(BTN_JOBS),   KeyboardButton(BTN_SUB)],
-            [KeyboardButton(BTN_FILTER), KeyboardButton(BTN_MENU)],
-            [KeyboardButton(BTN_HELP),   KeyboardButton(BTN_PRIVACY)],
-        ],
-        resize_keyboard=True,
-        is_persistent=True,
-        input_field_placeholder="Choose an action or type a command...",
-    )
-
+# Built once at import time — these markups never change, so every handler
+# reuses the same objects instead of rebuilding the button graph per update.
+
+# Persistent keyboard at the bottom of the chat.
+# Only visible in private/direct messages — never shown in group posts.
+BOTTOM_KEYBOARD = ReplyKeyboardMarkup(
+    [
+        [KeyboardButton(BTN_JOBS),   KeyboardButton(BTN_SUB)],
+        [KeyboardButton(BTN_FILTER), KeyboardButton(BTN_MENU)],
+        [KeyboardButton(BTN_HELP),   KeyboardButton(BTN_PRIVACY)],
+    ],
+    resize_keyboard=True,
+    is_persistent=True,
+    input_field_placeholder="Choose an action or type a command...",
+)
 
-def main_menu_inline():
-    """Inline buttons inside the message — used for the main menu."""
-    return InlineKeyboardMarkup([
-        [InlineKeyboardButton("🔍 Latest Jobs",         callback_data="latest_jobs")],
-        [
-            InlineKeyboardButton("🔔 Subscribe",        callback_data="subscribe"),
-            InlineKeyboardButton("🔕 Stop Alerts",      callback_data="unsubscribe"),
-        ],
-        [InlineKeyboardButton("⚙️ Choose Job Type",     callback_data="filter_menu")],
-        [
-            InlineKeyboardButton("📊 My Status",        callback_data="my_status"),
-            InlineKeyboardButton("📈 Bot Stats",        callback_data="stats"),
-        ],
-        [
-            InlineKeyboardButton("❓ Help",             callback_data="help"),
-            InlineKeyboardButton("📋 Terms & Privacy",  callback_data="privacy"),
-        ],
-    ])
+# Inline buttons inside the message — used for the main menu.
+MAIN_MENU_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔍 Latest Jobs",         callback_data="latest_jobs")],
+    [
+        InlineKeyboardButton("🔔 Subscribe",        callback_data="subscribe"),
+        InlineKeyboardButton("🔕 Stop Alerts",      callback_data="unsubscribe"),
+    ],
+    [InlineKeyboardButton("⚙️ Choose Job Type",     callback_data="filter_menu")],
+    [
+        InlineKeyboardButton("📊 My Status",        callback_data="my_status"),
+        InlineKeyboardButton("📈 Bot Stats",        callback_data="stats"),
+    ],
+    [
+        InlineKeyboardButton("❓ Help",             callback_data="help"),
+        InlineKeyboardButton("📋 Terms & Privacy",  callback_data="privacy"),
+    ],
+])
+
+# Job type picker — shared by /filter and the "Choose Job Type" button.
+FILTER_MENU_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📋 All Jobs",                callback_data="filter_all")],
+    [InlineKeyboardButton("📞 Call Center / BPO",       callback_data="filter_callcenter")],
+    [InlineKeyboardButton("💻 Virtual Assistant (VA)",  callback_data="filter_va")],
+    [InlineKeyboardButton("🎰 POGO / Online Gaming",    callback_data="filter_pogo")],
+    [InlineKeyboardButton("🏠 Remote / Work From Home", callback_data="filter_remote")],
+    [InlineKeyboardButton("💰 Accounting / Finance",    callback_data="filter_accounting")],
+    [InlineKeyboardButton("🖥️ IT / Tech Support",       callback_data="filter_it")],
+    [InlineKeyboardButton("📈 Sales / Marketing",       callback_data="filter_sales")],
+    [InlineKeyboardButton("🏥 Healthcare / Nursing",    callback_data="filter_healthcare")],
+])
+
+FILTER_MAP = {
+    "filter_all":        "All",
+    "filter_callcenter": "Call Center / BPO",
+    "filter_va":         "Virtual Assistant",
+    "filter_pogo":       "POGO / Online Gaming",
+    "filter_remote":     "Remote / WFH",
+    "filter_accounting": "Accounting / Finance",
+    "filter_it":         "IT / Tech",
+    "filter_sales":      "Sales / Marketing",
+    "filter_healthcare": "Healthcare",
+}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -178,6 +234,126 @@ Reach out to the bot admin if you have any concerns or questions.
 _By continuing to use this bot, you agree to these terms._
 """.strip()
 
+WELCOME_TEMPLATE = (
+    "👋 *{greeting}, {name}!*\n\n"
+    "I'm *Job Scrapper PH* 🤖🇵🇭\n"
+    "I help Filipinos find *legit and updated* job opportunities!\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "💼 *Job Categories I Search:*\n\n"
+    "📞 Call Center / BPO / CSR\n"
+    "💻 Virtual Assistant (VA)\n"
+    "🎰 POGO / Online Gaming\n"
+    "🏠 Remote / Work From Home\n"
+    "💰 Accounting / Finance\n"
+    "🖥️ IT / Tech Support\n"
+    "📈 Sales / Marketing\n"
+    "🏥 Healthcare / Nursing\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "🌐 *Job Sources:*\n"
+    "Indeed PH • JobStreet • LinkedIn\n"
+    "OnlineJobs.ph • Kalibrr • Jooble\n"
+    "Trabaho.ph • BossJob • PhilJobNet\n\n"
+    "📲 *Use the buttons below to get started!* 👇"
+)
+
+HELP_TEXT = (
+    "❓ *Help & Commands*\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "📱 *Available Commands:*\n\n"
+    "/start — Main menu\n"
+    "/jobs — Show latest 15 job posts\n"
+    "/subscribe — Turn on job alert notifications\n"
+    "/unsubscribe — Turn off notifications\n"
+    "/filter — Choose your preferred job type\n"
+    "/status — View your subscription settings\n"
+    "/stats — Bot statistics\n"
+    "/privacy — Terms & Privacy Policy\n"
+    "/deletedata — Delete your personal data\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "🔔 *How does the bot work?*\n\n"
+    "1️⃣ Tap the 🔔 *Subscribe* button\n"
+    "2️⃣ Choose your preferred *job type* via Filter\n"
+    "3️⃣ The bot will notify you whenever a *new job is posted*!\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    f"⏱ *How often does it update?*\n"
+    f"Every *{CHECK_INTERVAL_MINUTES} minutes* the bot checks for new jobs.\n\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "💡 *Tips:*\n"
+    "• Set a job filter so you only get relevant notifications\n"
+    "• Never pay to get a job — that's a scam!\n"
+    "• Always verify the employer before applying\n\n"
+    "🆘 Contact the bot admin if you have any issues."
+)
+
+CALLBACK_HELP_TEXT = (
+    "❓ *Help*\n\n"
+    "Use the menu buttons or type these commands:\n\n"
+    "/jobs — Latest job postings\n"
+    "/subscribe — Turn on alerts\n"
+    "/unsubscribe — Turn off alerts\n"
+    "/filter — Choose job type\n"
+    "/status — View your settings\n"
+    "/privacy — Terms & Privacy Policy\n"
+    "/deletedata — Delete your data"
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  DATABASE — runs on worker threads so SQLite never blocks the event loop
+# ═══════════════════════════════════════════════════════════════════════════════
+
+async def _db(func, *args, **kwargs):
+    """Run a synchronous Database method in the default thread pool."""
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+async def cached_user(context: ContextTypes.DEFAULT_TYPE, user_id: int):
+    """
+    db.get_user memoized in context.user_data, PTB's per-user in-memory store.
+    Call forget_user() after every write to the user's row.
+    """
+    row = context.user_data.get("_user")
+    if row is None:
+        row = await _db(db.get_user, user_id)
+        context.user_data["_user"] = row
+    return row
+
+
+def forget_user(context: ContextTypes.DEFAULT_TYPE):
+    context.user_data.pop("_user", None)
+
+
+async def ensure_user(user) -> bool:
+    """
+    db.add_user, skipped for users this process has already registered.
+    Returns True only when the user was newly inserted.
+    """
+    if user.id in _known_users:
+        _known_users.move_to_end(user.id)
+        return False
+    is_new = await _db(db.add_user, user.id, user.first_name or "there")
+    _known_users[user.id] = None
+    if len(_known_users) > KNOWN_USERS_MAX:
+        _known_users.popitem(last=False)
+    return is_new
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  CACHED STATS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+async def cached_stats() -> dict:
+    """
+    Bot-wide counters, refreshed at most once every STATS_TTL_SECONDS.
+    The lock makes concurrent Stats taps share a single DB round-trip.
+    """
+    async with _stats_lock:
+        now = time.monotonic()
+        if _stats_cache["val"] is None or now - _stats_cache["ts"] > STATS_TTL_SECONDS:
+            _stats_cache["val"] = await _db(db.get_stats)
+            _stats_cache["ts"]  = now
+        return _stats_cache["val"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  COMMANDS — PRIVATE CHAT ONLY (unless stated)
@@ -189,40 +365,25 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     user     = update.effective_user
-    is_new   = db.add_user(user.id, user.first_name or "there")
+    is_new   = await ensure_user(user)
+    # Re-read on /start: the broadcast may have unsubscribed a user who blocked the bot
+    forget_user(context)
     greeting = "Welcome" if is_new else "Welcome back"
 
-    welcome = (
-        f"👋 *{greeting}, {user.first_name}!*\n\n"
-        "I'm *Job Scrapper PH* 🤖🇵🇭\n"
-        "I help Filipinos find *legit and updated* job opportunities!\n\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "💼 *Job Categories I Search:*\n\n"
-        "📞 Call Center / BPO / CSR\n"
-        "💻 Virtual Assistant (VA)\n"
-        "🎰 POGO / Online Gaming\n"
-        "🏠 Remote / Work From Home\n"
-        "💰 Accounting / Finance\n"
-        "🖥️ IT / Tech Support\n"
-        "📈 Sales / Marketing\n"
-        "🏥 Healthcare / Nursing\n\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "🌐 *Job Sources:*\n"
-        "Indeed PH • JobStreet • LinkedIn\n"
-        "OnlineJobs.ph • Kalibrr • Jooble\n"
-        "Trabaho.ph • BossJob • PhilJobNet\n\n"
-        "📲 *Use the buttons below to get started!* 👇"
+    welcome  = WELCOME_TEMPLATE.format(
+        greeting=greeting,
+        name=escape_markdown(user.first_name or "there"),
     )
 
     await update.message.reply_text(
         welcome,
         parse_mode="Markdown",
-        reply_markup=bottom_keyboard(),
+        reply_markup=BOTTOM_KEYBOARD,
     )
     await update.message.reply_text(
         "🏠 *Main Menu:*",
         parse_mode="Markdown",
-        reply_markup=main_menu_inline(),
+        reply_markup=MAIN_MENU_MARKUP,
     )
 
 
@@ -230,38 +391,10 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.effective_chat.type != "private":
         return
 
-    text = (
-        "❓ *Help & Commands*\n\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "📱 *Available Commands:*\n\n"
-        "/start — Main menu\n"
-        "/jobs — Show latest 15 job posts\n"
-        "/subscribe — Turn on job alert notifications\n"
-        "/unsubscribe — Turn off notifications\n"
-        "/filter — Choose your preferred job type\n"
-        "/status — View your subscription settings\n"
-        "/stats — Bot statistics\n"
-        "/privacy — Terms & Privacy Policy\n"
-        "/deletedata — Delete your personal data\n\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "🔔 *How does the bot work?*\n\n"
-        "1️⃣ Tap the 🔔 *Subscribe* button\n"
-        "2️⃣ Choose your preferred *job type* via Filter\n"
-        "3️⃣ The bot will notify you whenever a *new job is posted*!\n\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        f"⏱ *How often does it update?*\n"
-        f"Every *{CHECK_INTERVAL_MINUTES} minutes* the bot checks for new jobs.\n\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "💡 *Tips:*\n"
-        "• Set a job filter so you only get relevant notifications\n"
-        "• Never pay to get a job — that's a scam!\n"
-        "• Always verify the employer before applying\n\n"
-        "🆘 Contact the bot admin if you have any issues."
-    )
     await update.message.reply_text(
-        text,
+        HELP_TEXT,
         parse_mode="Markdown",
-        reply_markup=main_menu_inline(),
+        reply_markup=MAIN_MENU_MARKUP,
     )
 
 
@@ -271,14 +404,14 @@ async def privacy_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(
         PRIVACY_TEXT,
         parse_mode="Markdown",
-        reply_markup=main_menu_inline(),
+        reply_markup=MAIN_MENU_MARKUP,
     )
 
 
 async def jobs_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     is_private = update.effective_chat.type == "private"
     if is_private:
-        user_data   = db.get_user(update.effective_user.id)
+        user_data   = await cached_user(context, update.effective_user.id)
         user_filter = user_data.get("filters", "All") if user_data else "All"
         # Backward compat: treat old 'Lahat' default as 'All'
         if user_filter == "Lahat":
@@ -308,57 +441,48 @@ async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     user = update.effective_user
-    db.add_user(user.id, user.first_name or "there")
-    db.subscribe_user(user.id)
+    await ensure_user(user)
+    await _db(db.subscribe_user, user.id)
+    forget_user(context)
     await update.message.reply_text(
         "🔔 *You are now subscribed!*\n\n"
         "✅ You will be notified whenever new jobs are posted.\n"
         "⚙️ Tap *Job Filter* to choose your preferred job type.\n"
         "🔕 Tap *Stop Alerts* to unsubscribe anytime.",
         parse_mode="Markdown",
-        reply_markup=main_menu_inline(),
+        reply_markup=MAIN_MENU_MARKUP,
     )
 
 
 async def unsubscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.effective_chat.type != "private":
         return
-    db.unsubscribe_user(update.effective_user.id)
+    await _db(db.unsubscribe_user, update.effective_user.id)
+    forget_user(context)
     await update.message.reply_text(
         "🔕 *Job alerts have been turned off.*\n\n"
         "You will no longer receive notifications.\n"
         "Tap 🔔 *Subscribe* to turn them back on anytime! 😊",
         parse_mode="Markdown",
-        reply_markup=main_menu_inline(),
+        reply_markup=MAIN_MENU_MARKUP,
     )
 
 
 async def filter_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.effective_chat.type != "private":
         return
-    keyboard = [
-        [InlineKeyboardButton("📋 All Jobs",               callback_data="filter_all")],
-        [InlineKeyboardButton("📞 Call Center / BPO",      callback_data="filter_callcenter")],
-        [InlineKeyboardButton("💻 Virtual Assistant (VA)", callback_data="filter_va")],
-        [InlineKeyboardButton("🎰 POGO / Online Gaming",   callback_data="filter_pogo")],
-        [InlineKeyboardButton("🏠 Remote / Work From Home",callback_data="filter_remote")],
-        [InlineKeyboardButton("💰 Accounting / Finance",   callback_data="filter_accounting")],
-        [InlineKeyboardButton("🖥️ IT / Tech Support",      callback_data="filter_it")],
-        [InlineKeyboardButton("📈 Sales / Marketing",      callback_data="filter_sales")],
-        [InlineKeyboardButton("🏥 Healthcare / Nursing",   callback_data="filter_healthcare")],
-    ]
     await update.message.reply_text(
         "⚙️ *Choose your preferred Job Type:*\n\n"
         "You will only receive notifications for the selected category.",
         parse_mode="Markdown",
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=FILTER_MENU_MARKUP,
     )
 
 
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.effective_chat.type != "private":
         return
-    user_data = db.get_user(update.effective_user.id)
+    user_data = await cached_user(context, update.effective_user.id)
     if not user_data:
         await update.message.reply_text(
             "No account found. Type /start to register! 😊"
@@ -377,18 +501,15 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         f"📅 Joined: {str(user_data['joined_at'])[:10]}\n\n"
         f"Tap ⚙️ *Job Filter* to change your preference.",
         parse_mode="Markdown",
-        reply_markup=main_menu_inline(),
+        reply_markup=MAIN_MENU_MARKUP,
     )
 
 
 async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.effective_chat.type != "private":
         return
-    total_users = db.count_users()
-    subscribed  = db.count_subscribed()
-    total_jobs  = db.count_jobs()
-    jobs_today  = db.count_jobs_today()
-    sources     = db.count_by_source()
+    stats   = await cached_stats()
+    sources = await _db(db.count_by_source)
 
     source_lines = "\n".join(
         f"  {SOURCE_ICONS.get(s['source'], '•')} {s['source']}: {s['count']} jobs"
@@ -397,10 +518,10 @@ async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     await update.message.reply_text(
         f"📈 *Bot Statistics:*\n\n"
-        f"👥 Total Users: *{total_users}*\n"
-        f"🔔 Subscribed: *{subscribed}*\n"
-        f"💼 Total Jobs Found: *{total_jobs}*\n"
-        f"🆕 New Jobs Today: *{jobs_today}*\n\n"
+        f"👥 Total Users: *{stats['total_users']}*\n"
+        f"🔔 Subscribed: *{stats['subscribed']}*\n"
+        f"💼 Total Jobs Found: *{stats['total_jobs']}*\n"
+        f"🆕 New Jobs Today: *{stats['jobs_today']}*\n\n"
         f"📡 *Jobs per Source:*\n{source_lines or '  No data yet'}",
         parse_mode="Markdown",
     )
@@ -434,8 +555,11 @@ async def scrape_now_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     if ADMIN_ID and user_id != ADMIN_ID:
         await update.message.reply_text("⛔ This command is for admins only.")
         return
+    if _broadcast_lock.locked():
+        await update.message.reply_text("⏳ A scrape is already running — please wait for it to finish.")
+        return
     await update.message.reply_text("🔍 Starting manual scrape now...")
-    await broadcast_new_jobs(context.bot)
+    await broadcast_new_jobs(context.bot, reuse_pages=True)
     await update.message.reply_text("✅ Scraping complete!")
 
 
@@ -460,7 +584,7 @@ async def reply_keyboard_handler(update: Update, context: ContextTypes.DEFAULT_T
         await update.message.reply_text(
             "🏠 *Main Menu:*",
             parse_mode="Markdown",
-            reply_markup=main_menu_inline(),
+            reply_markup=MAIN_MENU_MARKUP,
         )
     elif text == BTN_SUB:
         await subscribe_command(update, context)
@@ -470,7 +594,7 @@ async def reply_keyboard_handler(update: Update, context: ContextTypes.DEFAULT_T
         await update.message.reply_text(
             "I didn't understand that. 😅\n"
             "Use the buttons below or type /help to see all commands.",
-            reply_markup=main_menu_inline(),
+            reply_markup=MAIN_MENU_MARKUP,
         )
 
 
@@ -480,12 +604,20 @@ async def reply_keyboard_handler(update: Update, context: ContextTypes.DEFAULT_T
 
 async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
-    await query.answer()
     data  = query.data
     user  = query.from_user
 
+    # Drop accidental double-taps of the same button (no DB writes, no replies)
+    now  = time.monotonic()
+    last = context.user_data.get("_last_cb")
+    if last and last[0] == data and now - last[1] < CALLBACK_DEBOUNCE_SECONDS:
+        await query.answer("⏳ Please wait...")
+        return
+    context.user_data["_last_cb"] = (data, now)
+    await query.answer()
+
     if data == "latest_jobs":
-        user_data   = db.get_user(user.id)
+        user_data   = await cached_user(context, user.id)
         user_filter = user_data.get("filters", "All") if user_data else "All"
         await query.message.reply_text(
             "⏳ *Please wait, fetching the latest jobs...*",
@@ -494,8 +626,9 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await send_latest_jobs(query.message.chat_id, context.bot, limit=15, category_filter=user_filter)
 
     elif data == "subscribe":
-        db.add_user(user.id, user.first_name or "there")
-        db.subscribe_user(user.id)
+        await ensure_user(user)
+        await _db(db.subscribe_user, user.id)
+        forget_user(context)
         await query.message.reply_text(
             "🔔 *You are now subscribed!*\n\n"
             "✅ You will be notified when new jobs are posted.\n"
@@ -504,7 +637,8 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
     elif data == "unsubscribe":
-        db.unsubscribe_user(user.id)
+        await _db(db.unsubscribe_user, user.id)
+        forget_user(context)
         await query.message.reply_text(
             "🔕 *Alerts have been turned off.*\n"
             "Tap 🔔 Subscribe to turn them back on anytime.",
@@ -512,39 +646,18 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
     elif data == "filter_menu":
-        keyboard = [
-            [InlineKeyboardButton("📋 All Jobs",                callback_data="filter_all")],
-            [InlineKeyboardButton("📞 Call Center / BPO",       callback_data="filter_callcenter")],
-            [InlineKeyboardButton("💻 Virtual Assistant (VA)",  callback_data="filter_va")],
-            [InlineKeyboardButton("🎰 POGO / Online Gaming",    callback_data="filter_pogo")],
-            [InlineKeyboardButton("🏠 Remote / Work From Home", callback_data="filter_remote")],
-            [InlineKeyboardButton("💰 Accounting / Finance",    callback_data="filter_accounting")],
-            [InlineKeyboardButton("🖥️ IT / Tech Support",       callback_data="filter_it")],
-            [InlineKeyboardButton("📈 Sales / Marketing",       callback_data="filter_sales")],
-            [InlineKeyboardButton("🏥 Healthcare / Nursing",    callback_data="filter_healthcare")],
-        ]
         await query.message.reply_text(
             "⚙️ *Choose your preferred Job Type:*\n\n"
             "You will only receive notifications for the selected category.",
             parse_mode="Markdown",
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=FILTER_MENU_MARKUP,
         )
 
     elif data.startswith("filter_"):
-        filter_map = {
-            "filter_all":        "All",
-            "filter_callcenter": "Call Center / BPO",
-            "filter_va":         "Virtual Assistant",
-            "filter_pogo":       "POGO / Online Gaming",
-            "filter_remote":     "Remote / WFH",
-            "filter_accounting": "Accounting / Finance",
-            "filter_it":         "IT / Tech",
-            "filter_sales":      "Sales / Marketing",
-            "filter_healthcare": "Healthcare",
-        }
-        chosen = filter_map.get(data, "All")
-        db.add_user(user.id, user.first_name or "there")
-        db.set_filter(user.id, chosen)
+        chosen = FILTER_MAP.get(data, "All")
+        await ensure_user(user)
+        await _db(db.set_filter, user.id, chosen)
+        forget_user(context)
         icon = CATEGORY_ICONS.get(chosen, "💼")
         await query.message.reply_text(
             f"✅ *Filter set to:*\n{icon} *{chosen}*\n\n"
@@ -553,7 +666,7 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
     elif data == "my_status":
-        user_data = db.get_user(user.id)
+        user_data = await cached_user(context, user.id)
         if not user_data:
             await query.message.reply_text("Type /start first to register. 😊")
             return
@@ -569,43 +682,34 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
     elif data == "stats":
-        total_users = db.count_users()
-        subscribed  = db.count_subscribed()
-        total_jobs  = db.count_jobs()
-        jobs_today  = db.count_jobs_today()
+        stats = await cached_stats()
         await query.message.reply_text(
             f"📈 *Bot Statistics:*\n\n"
-            f"👥 Total Users: *{total_users}*\n"
-            f"🔔 Subscribed: *{subscribed}*\n"
-            f"💼 Total Jobs Found: *{total_jobs}*\n"
-            f"🆕 New Jobs Today: *{jobs_today}*",
+            f"👥 Total Users: *{stats['total_users']}*\n"
+            f"🔔 Subscribed: *{stats['subscribed']}*\n"
+            f"💼 Total Jobs Found: *{stats['total_jobs']}*\n"
+            f"🆕 New Jobs Today: *{stats['jobs_today']}*",
             parse_mode="Markdown",
         )
 
     elif data == "help":
         await query.message.reply_text(
-            "❓ *Help*\n\n"
-            "Use the menu buttons or type these commands:\n\n"
-            "/jobs — Latest job postings\n"
-            "/subscribe — Turn on alerts\n"
-            "/unsubscribe — Turn off alerts\n"
-            "/filter — Choose job type\n"
-            "/status — View your settings\n"
-            "/privacy — Terms & Privacy Policy\n"
-            "/deletedata — Delete your data",
+            CALLBACK_HELP_TEXT,
             parse_mode="Markdown",
-            reply_markup=main_menu_inline(),
+            reply_markup=MAIN_MENU_MARKUP,
         )
 
     elif data == "privacy":
         await query.message.reply_text(
             PRIVACY_TEXT,
             parse_mode="Markdown",
-            reply_markup=main_menu_inline(),
+            reply_markup=MAIN_MENU_MARKUP,
         )
 
     elif data == "confirm_delete":
-        db.delete_user(user.id)
+        await _db(db.delete_user, user.id)
+        forget_user(context)
+        _known_users.pop(user.id, None)
         await query.message.reply_text(
             "✅ *Your data has been deleted.*\n\n"
             "Thank you for using Job Scrapper PH!\n"
@@ -618,14 +722,71 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "❌ *Data deletion cancelled.*\n"
             "Your information is safe.",
             parse_mode="Markdown",
-            reply_markup=main_menu_inline(),
+            reply_markup=MAIN_MENU_MARKUP,
         )
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+#  RATE-LIMITED SENDING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def chat_limiter(chat_id) -> AsyncLimiter:
+    """Per-chat limiter: 1 msg/s for private chats, 20 msg/min for groups/channels."""
+    limiter = _chat_limiters.get(chat_id)
+    if limiter is not None:
+        _chat_limiters.move_to_end(chat_id)
+        return limiter
+    is_group = str(chat_id).startswith(("-", "@"))
+    limiter  = AsyncLimiter(20, 60) if is_group else AsyncLimiter(1, 1.0)
+    _chat_limiters[chat_id] = limiter
+    if len(_chat_limiters) > CHAT_LIMITERS_MAX:
+        _chat_limiters.popitem(last=False)
+    return limiter
+
+
+async def send_limited(bot, chat_id, text: str, **kwargs):
+    """bot.send_message gated by the per-chat limiter and the global SEND_LIMITER."""
+    async with chat_limiter(chat_id), SEND_LIMITER:
+        return await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  JOB DISPLAY
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _tg_len(text: str) -> int:
+    """Message length as Telegram counts it (UTF-16 code units)."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _tg_truncate(text: str, limit: int) -> str:
+    """text cut to at most `limit` UTF-16 code units, ending in "…" if it was cut."""
+    if _tg_len(text) <= limit:
+        return text
+    units = text.encode("utf-16-le")[:(limit - 1) * 2]
+    return units.decode("utf-16-le", errors="ignore") + "…"
+
+
+def pack_messages(parts: list, limit: int = TELEGRAM_MAX_MESSAGE_LEN) -> list:
+    """
+    Greedily group parts so each group, joined by JOB_SEPARATOR, fits in one
+    message. A part that is too long on its own is truncated to the limit.
+    """
+    batches, current, current_len = [], [], 0
+    sep_len = _tg_len(JOB_SEPARATOR)
+    for part in parts:
+        part     = _tg_truncate(part, limit)
+        part_len = _tg_len(part)
+        if current and current_len + sep_len + part_len > limit:
+            batches.append(current)
+            current, current_len = [], 0
+        current_len += part_len + (sep_len if current else 0)
+        current.append(part)
+    if current:
+        batches.append(current)
+    return batches
+
+
 async def send_latest_jobs(
     chat_id: int,
     bot,
@@ -634,14 +795,15 @@ async def send_latest_jobs(
     is_group: bool = False,
 ):
     if category_filter and category_filter != "All":
-        jobs = db.get_latest_jobs_by_category(category=category_filter, limit=limit)
+        jobs = await _db(db.get_latest_jobs_by_category, category=category_filter, limit=limit)
     else:
-        jobs = db.get_latest_jobs(limit=limit)
+        jobs = await _db(db.get_latest_jobs, limit=limit)
 
     if not jobs:
-        await bot.send_message(
-            chat_id=chat_id,
-            text=(
+        await send_limited(
+            bot,
+            chat_id,
+            (
                 "😔 *No jobs found at the moment.*\n\n"
                 "Please wait — the bot checks for new postings every few minutes. "
                 "Try again shortly! 🙏"
@@ -651,24 +813,43 @@ async def send_latest_jobs(
         return
 
     filter_text = f" ({category_filter})" if category_filter != "All" else ""
-    await bot.send_message(
-        chat_id=chat_id,
-        text=f"💼 *{len(jobs)} Latest Jobs{filter_text}:*",
-        parse_mode="Markdown",
-    )
+    parts = [f"💼 *{len(jobs)} Latest Jobs{filter_text}:*"]
+    parts.extend(format_job_message(job, is_group=is_group) for job in jobs)
 
-    for job in jobs:
-        msg = format_job_message(job, is_group=is_group)
+    # As few messages as fit under Telegram's length limit instead of one per job
+    for batch in pack_messages(parts):
         try:
-            await bot.send_message(
-                chat_id=chat_id,
-                text=msg,
+            await send_limited(
+                bot,
+                chat_id,
+                JOB_SEPARATOR.join(batch),
                 parse_mode="Markdown",
                 disable_web_page_preview=True,
             )
-            await asyncio.sleep(0.4)
+        except BadRequest as e:
+            logger.error(f"Error sending jobs to {chat_id}: {e}")
+            if len(batch) == 1:
+                continue
+            # One job with broken Markdown shouldn't sink the whole batch
+            for part in batch:
+                try:
+                    await send_limited(
+                        bot,
+                        chat_id,
+                        part,
+                        parse_mode="Markdown",
+                        disable_web_page_preview=True,
+                    )
+                except BadRequest as e:
+                    logger.error(f"Error sending job to {chat_id}: {e}")
+                except Exception as e:
+                    logger.error(f"Error sending job to {chat_id}: {e}")
+                    break
         except Exception as e:
-            logger.error(f"Error sending job to {chat_id}: {e}")
+            # Not a bad message: a timeout may already have been delivered and
+            # RetryAfter means back off, so resending the parts would only
+            # duplicate jobs or hit the flood wait.
+            logger.error(f"Error sending jobs to {chat_id}: {e}")
 
 
 def format_job_message(job: dict, is_group: bool = False) -> str:
@@ -679,8 +860,7 @@ def format_job_message(job: dict, is_group: bool = False) -> str:
     date_str = str(job.get("date_found", ""))[:16]
     salary   = f"\n💵 {job['salary']}" if job.get("salary") else ""
 
-    msg = (
-        f"{icon} *{job['title']}*\n"
+    details = (
         f"🏢 {job.get('company', 'Not specified')}\n"
         f"📂 {category}\n"
         f"📍 {job.get('location', 'Philippines')}"
@@ -690,28 +870,44 @@ def format_job_message(job: dict, is_group: bool = False) -> str:
     )
 
     if is_group:
-        msg += "\n\n⚠️ _Always verify the employer before applying. Never pay to get a job — that's a scam!_"
+        details += "\n\n⚠️ _Always verify the employer before applying. Never pay to get a job — that's a scam!_"
+
+    # Shorten an overlong title so the message (and its link) fits in one send
+    title    = job["title"]
+    overflow = _tg_len(f"{icon} *{title}*\n{details}") - TELEGRAM_MAX_MESSAGE_LEN
+    if overflow > 0:
+        title = _tg_truncate(title, max(_tg_len(title) - overflow, 1))
 
-    return msg
+    return f"{icon} *{title}*\n{details}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  BROADCAST — Personal Subscribers + Group
 # ═══════════════════════════════════════════════════════════════════════════════
 
-async def broadcast_new_jobs(bot):
+async def broadcast_new_jobs(bot, reuse_pages: bool = False):
+    if _broadcast_lock.locked():
+        logger.warning("⏳ Previous scrape/broadcast is still running — skipping this run.")
+        return
+    async with _broadcast_lock:
+        started = time.monotonic()
+        try:
+            await _db(db.set_state, "last_scrape_at", datetime.now().isoformat())
+            await _scrape_and_broadcast(bot, reuse_pages)
+        finally:
+            logger.info(f"⏱ Scrape/broadcast cycle finished in {time.monotonic() - started:.1f}s")
+
+
+async def _scrape_and_broadcast(bot, reuse_pages: bool):
     logger.info("🔍 Starting job scrape...")
     try:
-        new_jobs = await scraper.scrape_all()
+        new_jobs = await scraper.scrape_all(reuse_pages)
         logger.info(f"✅ Fetched {len(new_jobs)} potential jobs")
     except Exception as e:
         logger.error(f"Scraping error: {e}")
         return
 
-    saved_jobs = []
-    for job in new_jobs:
-        if db.save_job(job):
-            saved_jobs.append(job)
+    saved_jobs = await _db(db.save_jobs_bulk, new_jobs)
 
     logger.info(f"🆕 {len(saved_jobs)} new unique jobs saved")
     if not saved_jobs:
@@ -722,9 +918,10 @@ async def broadcast_new_jobs(bot):
     if GROUP_CHAT_ID:
         try:
             total = len(saved_jobs)
-            await bot.send_message(
-                chat_id=GROUP_CHAT_ID,
-                text=(
+            await send_limited(
+                bot,
+                GROUP_CHAT_ID,
+                (
                     f"📢 *{total} NEW JOB POSTING{'S' if total > 1 else ''}!* 🇵🇭\n"
                     f"━━━━━━━━━━━━━━━━━━━━━━\n"
                     f"Here are the latest opportunities for you! 💪\n"
@@ -733,18 +930,19 @@ async def broadcast_new_jobs(bot):
                 parse_mode="Markdown",
             )
             for job in saved_jobs[:10]:
-                await bot.send_message(
-                    chat_id=GROUP_CHAT_ID,
-                    text=format_job_message(job, is_group=True),
+                await send_limited(
+                    bot,
+                    GROUP_CHAT_ID,
+                    format_job_message(job, is_group=True),
                     parse_mode="Markdown",
                     disable_web_page_preview=True,
                 )
-                await asyncio.sleep(0.5)
 
             if total > 10:
-                await bot.send_message(
-                    chat_id=GROUP_CHAT_ID,
-                    text=f"➕ *{total - 10} more* new jobs available!\nMessage the bot directly to see all: /jobs",
+                await send_limited(
+                    bot,
+                    GROUP_CHAT_ID,
+                    f"➕ *{total - 10} more* new jobs available!\nMessage the bot directly to see all: /jobs",
                     parse_mode="Markdown",
                 )
             logger.info(f"✅ Posted to group {GROUP_CHAT_ID}: {min(total, 10)} jobs")
@@ -752,47 +950,81 @@ async def broadcast_new_jobs(bot):
             logger.error(f"Group broadcast error: {e}")
 
     # ── 2. Send to individual SUBSCRIBERS ──────────────────────────────────────
-    subscribers = db.get_subscribers()
-    logger.info(f"📤 Sending to {len(subscribers)} personal subscribers")
-
-    for user in subscribers:
-        user_filter  = user.get("filters", "All")
-        jobs_to_send = [
-            j for j in saved_jobs
-            if user_filter in ("All", "Lahat") or j.get("category") == user_filter
-        ]
-        if not jobs_to_send:
-            continue
+    # Look subscribers up per category instead of testing every job against
+    # every subscriber's filter. 'Lahat' is the legacy spelling of 'All'.
+    jobs_by_category = defaultdict(list)
+    for job in saved_jobs:
+        jobs_by_category[job.get("category")].append(job)
+
+    deliveries = []
+    for all_filter in ("All", "Lahat"):
+        users = await _db(db.get_subscribers_by_filter, all_filter)
+        deliveries.extend((user, saved_jobs) for user in users)
+    for category, category_jobs in jobs_by_category.items():
+        users = await _db(db.get_subscribers_by_filter, category)
+        deliveries.extend((user, category_jobs) for user in users)
+    logger.info(f"📤 Sending to {len(deliveries)} matching personal subscribers")
+
+    # A job's message text doesn't depend on the recipient — render each once.
+    rendered = {id(job): format_job_message(job) for job in saved_jobs}
+    # Same for the header: it only depends on how many jobs a subscriber gets.
+    headers = {
+        n: (
+            f"🔔 *{n} NEW JOB POSTING{'S' if n > 1 else ''} FOR YOU!* 🇵🇭\n\n"
+            f"Here are the latest jobs. Don't miss out! 💪"
+        )
+        for n in {len(jobs) for _, jobs in deliveries}
+    }
+
+    blocked = set()
 
+    async def deliver(user, jobs_to_send):
         try:
             total = len(jobs_to_send)
-            await bot.send_message(
-                chat_id=user["user_id"],
-                text=(
-                    f"🔔 *{total} NEW JOB POSTING{'S' if total > 1 else ''} FOR YOU!* 🇵🇭\n\n"
-                    f"Here are the latest jobs. Don't miss out! 💪"
-                ),
+            await send_limited(
+                bot,
+                user["user_id"],
+                headers[total],
                 parse_mode="Markdown",
             )
             for job in jobs_to_send[:5]:
-                await bot.send_message(
-                    chat_id=user["user_id"],
-                    text=format_job_message(job),
+                await send_limited(
+                    bot,
+                    user["user_id"],
+                    rendered[id(job)],
                     parse_mode="Markdown",
                     disable_web_page_preview=True,
                 )
-                await asyncio.sleep(0.4)
 
             if total > 5:
-                await bot.send_message(
-                    chat_id=user["user_id"],
-                    text=f"➕ *{total - 5} more* new jobs available! Type /jobs to see all.",
+                await send_limited(
+                    bot,
+                    user["user_id"],
+                    f"➕ *{total - 5} more* new jobs available! Type /jobs to see all.",
                     parse_mode="Markdown",
                 )
+        except Forbidden as e:
+            # Bot was blocked or the account was deactivated
+            logger.info(f"🚫 Cannot message {user['user_id']}: {e}")
+            blocked.add(user["user_id"])
         except Exception as e:
             logger.error(f"Broadcast error for {user['user_id']}: {e}")
-            if "blocked" in str(e).lower() or "deactivated" in str(e).lower():
-                db.unsubscribe_user(user["user_id"])
+
+    # Fan out one task per subscriber; the limiters in send_limited() keep the
+    # overall rate within Telegram's limits and deliver() never raises.
+    if hasattr(asyncio, "TaskGroup"):  # Python 3.11+
+        async with asyncio.TaskGroup() as tg:
+            for user, jobs_to_send in deliveries:
+                tg.create_task(deliver(user, jobs_to_send), name=f"send-{user['user_id']}")
+    else:
+        await asyncio.gather(
+            *(deliver(user, jobs_to_send) for user, jobs_to_send in deliveries),
+            return_exceptions=True,
+        )
+
+    if blocked:
+        await _db(db.bulk_unsubscribe, blocked)
+        logger.info(f"🔕 Unsubscribed {len(blocked)} users who blocked the bot")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -811,6 +1043,13 @@ def main():
     else:
         logger.info("ℹ️ No GROUP_CHAT_ID set — personal subscriber broadcast only.")
 
+    # uvloop is a faster drop-in event loop; PTB and APScheduler both pick
+    # it up through asyncio.get_event_loop() below.
+    if sys.platform != "win32":
+        import uvloop
+        uvloop.install()
+        logger.info("⚡ uvloop event loop installed")
+
     app = Application.builder().token(BOT_TOKEN).build()
 
     app.add_handler(CommandHandler("start",       start))
@@ -830,16 +1069,30 @@ def main():
         reply_keyboard_handler,
     ))
 
-    scheduler = AsyncIOScheduler()
+    scheduler = AsyncIOScheduler(event_loop=asyncio.get_event_loop())
+    # Resume the interval from the last scrape instead of scraping (and
+    # re-broadcasting) immediately on every restart.
+    next_run = datetime.now()
+    last_run = db.get_state("last_scrape_at")
+    if last_run:
+        next_run = max(next_run, datetime.fromisoformat(last_run) + timedelta(minutes=CHECK_INTERVAL_MINUTES))
+
     scheduler.add_job(
         broadcast_new_jobs,
         "interval",
         minutes=CHECK_INTERVAL_MINUTES,
         args=[app.bot],
-        next_run_time=datetime.now(),
+        next_run_time=next_run,
+        # A slow scrape must not stack up runs: misfires collapse into one
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=60,
     )
     scheduler.start()
-    logger.info(f"⏱ Scheduler started — checking every {CHECK_INTERVAL_MINUTES} minutes")
+    logger.info(
+        f"⏱ Scheduler started — checking every {CHECK_INTERVAL_MINUTES} minutes "
+        f"(next run: {next_run:%Y-%m-%d %H:%M})"
+    )
 
     logger.info("🤖 Job Scrapper PH is now running!")
     app.run_polling(drop_pending_updates=True)
@@ -16,23 +16,32 @@ FIXES APPLIED:
 """
 
 import asyncio
-import json
 import logging
 import os
 import re
+import threading
 import time
-import xml.etree.ElementTree as ET
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Iterator, Optional
+from urllib.parse import quote, urlencode, urlparse
 
+import orjson
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree as ET
+from lxml import html as lhtml
 
 logger = logging.getLogger(__name__)
 
+# ─── Optional API Keys (read once at import) ───────────────────────────────────
+JOOBLE_API_KEY = os.environ.get("JOOBLE_API_KEY", "")
+SERPAPI_KEY    = os.environ.get("SERPAPI_KEY", "")
+
 # ─── Rotate User Agents ────────────────────────────────────────────────────────
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -42,28 +51,34 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_2) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
 ]
 
+# Everything but the User-Agent is fixed, so one dict per user agent is built
+# at import and get_headers() just hands the next one out
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9,fil;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+}
+_HEADER_VARIANTS = [{"User-Agent": ua, **_BASE_HEADERS} for ua in USER_AGENTS]
+
 _ua_index = 0
 
 
 def get_headers(extra: dict = None) -> dict:
+    """
+    Browser-like headers with the next user agent. Without `extra` the shared
+    dict is returned, so treat it as read-only (merge into a copy instead).
+    """
     global _ua_index
     _ua_index = (_ua_index + 1) % len(USER_AGENTS)
-    h = {
-        "User-Agent": USER_AGENTS[_ua_index],
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.9,fil;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Cache-Control": "no-cache",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-    }
-    if extra:
-        h.update(extra)
-    return h
+    headers = _HEADER_VARIANTS[_ua_index]
+    return {**headers, **extra} if extra else headers
 
 
 def create_session() -> requests.Session:
@@ -85,8 +100,420 @@ def create_session() -> requests.Session:
     return session
 
 
+_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """
+    Session for the current scraper thread, created once and kept across
+    scrape cycles so keep-alive connections and TLS sessions get reused.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = create_session()
+    return session
+
+
+# ─── Conditional GET Cache ─────────────────────────────────────────────────────
+# Feed URL → (ETag, Last-Modified, jobs parsed from that body)
+_feed_cache: Dict[str, tuple] = {}
+
+
+def feed_validators(url: str) -> dict:
+    """If-None-Match / If-Modified-Since headers for a feed we've fetched before."""
+    cached = _feed_cache.get(url)
+    if not cached:
+        return {}
+    etag, last_modified, _ = cached
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def cached_feed_jobs(url: str, resp: requests.Response):
+    """Jobs from the last fetch if the server answered 304 Not Modified, else None."""
+    if resp.status_code == 304 and url in _feed_cache:
+        return [dict(job) for job in _feed_cache[url][2]]
+    return None
+
+
+def remember_feed(url: str, resp: requests.Response, jobs: List[Dict]):
+    etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        # Copies: scrape_all() sets "category" and pops "_description" in place
+        _feed_cache[url] = (etag, last_modified, [dict(job) for job in jobs])
+
+
+# ─── Indeed RSS Namespaces ─────────────────────────────────────────────────────
+# BUG FIX: Indeed uses http:// (not https://) in their RSS namespace
+INDEED_NS = [
+    "http://www.indeed.com/about/",   # correct
+    "https://www.indeed.com/about/",  # fallback
+]
+# Fully-qualified (company, city, state, salary) tags per namespace, built once
+INDEED_TAGS = [
+    tuple(f"{{{ns}}}{field}" for field in ("company", "city", "state", "salary"))
+    for ns in INDEED_NS
+]
+
+# ─── Precompiled Patterns ──────────────────────────────────────────────────────
+_WS_RE = re.compile(r"\s+")
+
+# Job card / field class names for the DOM fallbacks
+_PHILJOBNET_ROW_RE    = re.compile(r"vacancy|job|result", re.I)
+_LINKEDIN_CARD_RE     = re.compile(r"base-card|job-search-card|job-card", re.I)
+_LINKEDIN_ITEM_RE     = re.compile(r"result-card|jobs-search-results__list-item", re.I)
+_ONLINEJOBS_CARD_RE   = re.compile(r"job.?post|jobpost|job.?row", re.I)
+_TRABAHO_CARD_RE      = re.compile(r"job.?item|job.?listing|vacancy|job.?card", re.I)
+_MONSTER_CARD_RE      = re.compile(r"job.?card|job-summary|result", re.I)
+_FREELANCER_CARD_RE   = re.compile(r"JobSearchCard|job-item", re.I)
+_OLX_CARD_RE          = re.compile(r"offer|listing|item", re.I)
+_TITLE_CLASS_RE       = re.compile(r"job-title|position", re.I)
+_COMPANY_CLASS_RE     = re.compile(r"company|employer", re.I)
+_CLIENT_CLASS_RE      = re.compile(r"company|employer|client", re.I)
+_SUBTITLE_CLASS_RE    = re.compile(r"company|subtitle", re.I)
+_NAME_CLASS_RE        = re.compile(r"company|employer|name", re.I)
+_LOCALE_CLASS_RE      = re.compile(r"location|locale", re.I)
+_CITY_CLASS_RE        = re.compile(r"location|city", re.I)
+_RATE_CLASS_RE        = re.compile(r"rate|salary|pay", re.I)
+_PRICE_CLASS_RE       = re.compile(r"price|salary", re.I)
+_DESCRIPTION_CLASS_RE = re.compile(r"description|summary", re.I)
+
+# Fields pulled out of RSS descriptions
+_PHILJOBNET_COMPANY_RE  = re.compile(r"(?:Company|Employer):\s*(.+?)(?:\n|<)")
+_PHILJOBNET_LOCATION_RE = re.compile(r"(?:Location|Address|City):\s*(.+?)(?:\n|<)")
+_UPWORK_BUDGET_RE       = re.compile(r"Budget:\s*\$?([\d,]+(?:\s*[-–]\s*\$?[\d,]+)?)")
+_USD_AMOUNT_RE          = re.compile(r"\$([\d,]+(?:\s*[-–]\s*[\d,]+)?)")
+
+# Fields in Telegram channel posts
+_COMPANY_RE  = re.compile(r"(?:company|employer|client):\s*(.+?)(?:\n|$)", re.I)
+_SALARY_RE   = re.compile(r"(?:salary|pay|rate|compensation):\s*(.+?)(?:\n|$)", re.I)
+_TITLE_KW_RE = re.compile(r"hiring|looking for|vacancy|job|position|needed", re.I)
+
+# ─── HTML Parsing ──────────────────────────────────────────────────────────────
+# libxml2 instead of the pure-Python html.parser; strainers build only the tags
+# a scraper actually reads and skip the rest of the page
+HTML_PARSER  = "lxml"
+JSONLD_ONLY  = SoupStrainer("script", type="application/ld+json")
+SCRIPTS_ONLY = SoupStrainer("script")  # JSON-LD + __NEXT_DATA__
+
+# ─── Search Terms (URL-encoded once at import) ─────────────────────────────────
+# (term, query-string form)
+JOOBLE_TERMS = tuple(
+    (term, term.replace(" ", "+"))
+    for term in ("call center", "virtual assistant", "BPO", "work from home", "customer service")
+)
+
+PHILJOBNET_SEARCH_URLS = tuple(
+    f"https://www.philjobnet.gov.ph/index.php?option=com_philjobnet&view=vacancies&task=search&q={kw.replace(' ', '+')}"
+    for kw in ("call center", "virtual assistant", "BPO", "nursing")
+)
+
+# (keywords, guest API URL, regular search page URL)
+LINKEDIN_SEARCHES = tuple(
+    (
+        keywords,
+        f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?"
+        f"keywords={quote(keywords)}&location={quote(location)}&f_TPR=r86400&sortBy=DD&start=0",
+        f"https://www.linkedin.com/jobs/search?"
+        f"keywords={quote(keywords)}&location={quote(location)}&f_TPR=r86400&sortBy=DD",
+    )
+    for keywords, location in (
+        ("call center agent", "Philippines"),
+        ("virtual assistant", "Philippines"),
+        ("BPO customer service", "Philippines"),
+        ("work from home Philippines", ""),
+        ("accounting remote Philippines", ""),
+        ("IT support Philippines", ""),
+    )
+)
+
+# ─── lxml Trees (DOM fallbacks) ────────────────────────────────────────────────
+# Card scans run as compiled XPath on a bare lxml tree instead of wrapping every
+# node in a BeautifulSoup object. EXSLT re:test gives the same class matching
+# as bs4's class_=<regex> (search over the class attribute, case-insensitive).
+_EXSLT = {"re": "http://exslt.org/regular-expressions"}
+_UTF8_HTML_PARSER = lhtml.HTMLParser(encoding="utf-8")
+
+
+def _class_xpath(tag: str, pattern: re.Pattern) -> ET.XPath:
+    return ET.XPath(f".//{tag}[re:test(@class, '{pattern.pattern}', 'i')]", namespaces=_EXSLT)
+
+
+_ONLINEJOBS_CARDS = _class_xpath("div", _ONLINEJOBS_CARD_RE)
+_TRABAHO_CARDS    = _class_xpath("div", _TRABAHO_CARD_RE)
+_MONSTER_CARDS    = _class_xpath("div", _MONSTER_CARD_RE)
+_OLX_CARDS        = _class_xpath("li", _OLX_CARD_RE)
+_LINKEDIN_CARDS   = _class_xpath("div", _LINKEDIN_CARD_RE)
+_LINKEDIN_ITEMS   = _class_xpath("li", _LINKEDIN_ITEM_RE)
+_PHILJOBNET_ROWS  = _class_xpath("*[self::div or self::tr]", _PHILJOBNET_ROW_RE)
+_FREELANCER_CARDS = _class_xpath("div", _FREELANCER_CARD_RE)
+_CLIENT_XP        = _class_xpath("*", _CLIENT_CLASS_RE)
+_COMPANY_XP       = _class_xpath("*", _COMPANY_CLASS_RE)
+_NAME_XP          = _class_xpath("*", _NAME_CLASS_RE)
+_CITY_XP          = _class_xpath("*", _CITY_CLASS_RE)
+_RATE_XP          = _class_xpath("*", _RATE_CLASS_RE)
+_PRICE_XP         = _class_xpath("*", _PRICE_CLASS_RE)
+_TITLE_XP         = _class_xpath("*", _TITLE_CLASS_RE)
+_SUBTITLE_XP      = _class_xpath("*", _SUBTITLE_CLASS_RE)
+_LOCALE_XP        = _class_xpath("*", _LOCALE_CLASS_RE)
+_DESCRIPTION_XP   = _class_xpath("*", _DESCRIPTION_CLASS_RE)
+
+_LINK_XP            = ET.XPath(".//a[@href]")
+_HEADING_OR_LINK_XP = ET.XPath(".//*[self::h2 or self::h3 or self::a]")
+_OLX_TITLE_XP       = ET.XPath(".//*[self::h3 or self::h4 or self::strong]")
+_HEADING_XP         = ET.XPath(".//*[self::h2 or self::h3]")
+_H2_XP              = ET.XPath(".//h2")
+_H3_XP              = ET.XPath(".//h3")
+_H4_XP              = ET.XPath(".//h4")
+_TD_XP              = ET.XPath(".//td")
+_ARTICLES           = ET.XPath("//article")
+_LOGIN_FORM         = ET.XPath('//form[@id="login"]')
+_JSONLD_TEXT        = ET.XPath('//script[@type="application/ld+json"]/text()', smart_strings=False)
+_NORMALIZED_TEXT    = ET.XPath("normalize-space()", smart_strings=False)
+
+# t.me/s/<channel>: each post is a div.tgme_widget_message carrying data-post,
+# with its body in a div.tgme_widget_message_text (posts without text skipped)
+_TG_TEXT_DIV = "div[contains(concat(' ', normalize-space(@class), ' '), ' tgme_widget_message_text ')]"
+_TG_MESSAGES = ET.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' tgme_widget_message ')]"
+    f"[.//{_TG_TEXT_DIV}]"
+)
+_TG_TEXT       = ET.XPath(f".//{_TG_TEXT_DIV}")
+_TG_TEXT_OR_BR = ET.XPath(".//text() | .//br")  # document order
+
+
+def html_text(resp: requests.Response) -> str:
+    """
+    Response body as text, decoded with the charset the server declared or
+    else UTF-8. resp.text would run charset detection over the whole body
+    whenever the header has no charset, and fall back to Latin-1 for text/html.
+    """
+    charset = resp.encoding if "charset=" in resp.headers.get("Content-Type", "").lower() else None
+    try:
+        return resp.content.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return resp.content.decode("utf-8", errors="replace")
+
+
+def html_soup(resp: requests.Response, parse_only: SoupStrainer = None) -> BeautifulSoup:
+    """BeautifulSoup document for a response — the one place the bs4 parser is chosen."""
+    return BeautifulSoup(html_text(resp), HTML_PARSER, parse_only=parse_only)
+
+
+def html_tree(resp: requests.Response):
+    """lxml HTML document for a response, decoded the same way as html_text()."""
+    body = html_text(resp).encode("utf-8")
+    return lhtml.document_fromstring(body, parser=_UTF8_HTML_PARSER)
+
+
+def first(xpath: ET.XPath, node):
+    """First match of a compiled XPath under `node`, or None."""
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def first_of(node, *xpaths):
+    """First match of the first XPath (in order) that matches anything under `node`."""
+    for xpath in xpaths:
+        found = first(xpath, node)
+        if found is not None:
+            return found
+    return None
+
+
+def node_text(node) -> str:
+    return _NORMALIZED_TEXT(node)
+
+
+def post_text(node) -> str:
+    """
+    Text of a Telegram post body: text nodes stripped and joined with a space,
+    as get_text(" ", strip=True) did, with <br> line breaks kept as newlines.
+    """
+    lines, pieces = [], []
+    for item in _TG_TEXT_OR_BR(node):
+        if isinstance(item, str):
+            item = item.strip()
+            if item:
+                pieces.append(item)
+        else:
+            lines.append(" ".join(pieces))
+            pieces = []
+    lines.append(" ".join(pieces))
+    return "\n".join(lines).strip()
+
+
+def first_lines(text: str, n: int) -> List[str]:
+    """The first n non-blank lines of text, stripped, without splitting the rest."""
+    lines = []
+    start = 0
+    while len(lines) < n and start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        line = text[start:end].strip()
+        if line:
+            lines.append(line)
+        start = end + 1
+    return lines
+
+
 TIMEOUT = 20  # seconds per request
 
+# One thread per source so every scraper runs at once
+SCRAPER_THREADS = 20
+
+# Whole-cycle budget; sources still running after this are skipped for the cycle
+SCRAPE_DEADLINE = 180  # seconds
+
+# Requests one scraper may have in flight to its host at once (fetch_all)
+HOST_CONCURRENCY = 3
+
+# Per-host request rate (requests/second, burst) — replaces fixed sleeps
+HOST_RATE  = 2.0
+HOST_BURST = 4
+HOST_RATES = {
+    "www.linkedin.com":     (0.5, 1),  # LinkedIn blocks fast clients
+    "www.jobstreet.com.ph": (1.0, 2),
+}
+
+# HTML pages are read up to this size (get_page); the job data comes well
+# before that, the rest would be inline analytics/JS bundles
+MAX_PAGE_BYTES = 3_000_000
+
+# Listing pages fetched by fetch_all() are reused for this long, so a manual
+# /scrapnow right after a cycle doesn't hit every site again. Scheduled cycles
+# call scrape_all(reuse_pages=False), which empties the cache first, so they
+# always see fresh pages whatever CHECK_INTERVAL_MINUTES is set to.
+PAGE_CACHE_TTL = 600  # seconds
+
+# Long-lived so each worker's thread-local Session stays warm across cycles
+_fetch_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="fetch")
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate     = rate
+        self.capacity = capacity
+        self.tokens   = float(capacity)
+        self.updated  = time.monotonic()
+        self.lock     = threading.Lock()
+
+    def acquire(self):
+        # Tokens may go negative: each caller reserves the next free slot and
+        # sleeps until it, outside the lock, so waiters don't serialize.
+        with self.lock:
+            now          = time.monotonic()
+            self.tokens  = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait         = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def throttle(url: str):
+    """Wait for a request slot on url's host. Call right before the request."""
+    host = urlparse(url).netloc
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(*HOST_RATES.get(host, (HOST_RATE, HOST_BURST)))
+    bucket.acquire()
+
+
+class Page:
+    """
+    What get_page() read: the response's status, final URL and headers, and a
+    body of at most max_bytes. `truncated` is set when the body was cut there.
+    Reads like a Response for html_text() / html_tree() / html_soup().
+    """
+
+    def __init__(self, resp: requests.Response, content: bytes, truncated: bool):
+        self.status_code = resp.status_code
+        self.url         = resp.url
+        self.headers     = resp.headers
+        self.encoding    = resp.encoding
+        self.content     = content
+        self.truncated   = truncated
+
+
+def get_page(session: requests.Session, url: str, headers: dict, max_bytes: int = MAX_PAGE_BYTES) -> Page:
+    """
+    GET a page, streaming the body and reading at most max_bytes of it so an
+    oversized page can't stall a scraper.
+    """
+    resp = session.get(url, headers=headers, timeout=TIMEOUT, stream=True)
+    body, truncated = bytearray(), False
+    try:
+        for chunk in resp.iter_content(chunk_size=65536):
+            body += chunk
+            if len(body) >= max_bytes:
+                truncated = True
+                del body[max_bytes:]
+                break
+    finally:
+        resp.close()
+    if truncated:
+        logger.warning(f"✂️ {url}: body cut at {max_bytes:,} bytes")
+    return Page(resp, bytes(body), truncated)
+
+
+def fetch_all(urls: List[str], extra_headers: dict = None) -> List[Optional[Page]]:
+    """
+    GET every URL concurrently, at most HOST_CONCURRENCY at a time, and return
+    the responses in the same order (None where the request itself failed).
+    """
+    gate    = threading.Semaphore(HOST_CONCURRENCY)
+    headers = get_headers(extra_headers)  # one user agent for the whole batch
+
+    def fetch(url):
+        key    = (url, tuple(sorted(extra_headers.items())) if extra_headers else ())
+        cached = _page_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        with gate:
+            throttle(url)
+            try:
+                resp = get_page(get_session(), url, headers)
+            except requests.RequestException as e:
+                logger.debug(f"GET {url}: {e}")
+                return None
+        if resp.status_code == 200 and not resp.truncated:
+            remember_page(key, resp)
+        return resp
+
+    return list(_fetch_pool.map(fetch, urls))
+
+
+# (url, extra headers) → (expires at, complete 200 page); only ever holds one cycle's pages
+_page_cache: Dict[tuple, tuple] = {}
+_page_cache_lock = threading.Lock()
+
+
+def remember_page(key: tuple, resp: Page):
+    now = time.monotonic()
+    with _page_cache_lock:
+        for stale in [k for k, (expires, _) in _page_cache.items() if expires <= now]:
+            del _page_cache[stale]
+        _page_cache[key] = (now + PAGE_CACHE_TTL, resp)
+
+
+def forget_pages():
+    """Drop every cached page, so the next fetch_all() calls hit the network."""
+    with _page_cache_lock:
+        _page_cache.clear()
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  KEYWORDS & CATEGORY DETECTION
@@ -145,13 +572,64 @@ KEYWORDS = {
 ALL_KEYWORDS = [kw for kws in KEYWORDS.values() for kw in kws]
 
 
+CATEGORIES = list(KEYWORDS)
+
+
+def _trie_regex(words) -> str:
+    """
+    Regex matching exactly `words`, with shared prefixes factored into a trie
+    ("tier (?:1|2)") so the engine walks common prefixes once.
+    Optional tails are greedy, so at any position the longest word wins.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return emit(trie)
+
+
+# Lowercased keyword → index of the first category in KEYWORDS that lists it
+_KEYWORD_INDEX = {}
+for _index, _keywords in enumerate(KEYWORDS.values()):
+    for _kw in _keywords:
+        _KEYWORD_INDEX.setdefault(_kw.lower(), _index)
+
+# The trie reports only the longest keyword at each position, and any shorter
+# keyword matching there is a prefix of it — so fold prefixes into the lookup.
+_KEYWORD_CATEGORY = {
+    kw: min(index for other, index in _KEYWORD_INDEX.items() if kw.startswith(other))
+    for kw in _KEYWORD_INDEX
+}
+
+# One pass over the text finds every keyword; the lookahead lets matches
+# overlap so no keyword can hide another.
+_KEYWORD_RE = re.compile("(?=(" + _trie_regex(_KEYWORD_CATEGORY) + "))")
+
+# Only the start of a description is used for the category, so detect_category's
+# cache keys stay small (Indeed's RSS descriptions are whole HTML bodies)
+CATEGORY_DESCRIPTION_CHARS = 300
+
+
+@lru_cache(maxsize=4096)
 def detect_category(title: str, description: str = "") -> str:
+    """First category in KEYWORDS with a keyword anywhere in the text, else 'General'."""
     text = (title + " " + description).lower()
-    for category, keywords in KEYWORDS.items():
-        for kw in keywords:
-            if kw.lower() in text:
-                return category
-    return "General"
+    best = len(CATEGORIES)
+    for m in _KEYWORD_RE.finditer(text):
+        best = min(best, _KEYWORD_CATEGORY[m.group(1)])
+        if best == 0:
+            break
+    return CATEGORIES[best] if best < len(CATEGORIES) else "General"
 
 
 def is_relevant(title: str, description: str = "") -> bool:
@@ -159,30 +637,184 @@ def is_relevant(title: str, description: str = "") -> bool:
     return bool(title and title.strip())
 
 
+@lru_cache(maxsize=4096)
 def clean(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "")).strip()
+    return _WS_RE.sub(" ", text or "").strip()
+
+
+def iter_rss_items(resp: requests.Response, limit: int = None):
+    """
+    Stream <item> elements out of a streamed (stream=True) RSS response.
+    Chunks are fed to the parser as they arrive, so parsing overlaps the
+    download, and each item (plus the siblings already seen) is freed once
+    the caller is done with it, so the whole feed is never held in memory.
+    Already-downloaded responses work too: iter_content replays the body.
+    """
+    parser = ET.XMLPullParser(events=("end",), tag="item")
+    count  = 0
+    for chunk in resp.iter_content(chunk_size=16384):
+        parser.feed(chunk)
+        for _, item in parser.read_events():
+            yield item
+            item.clear(keep_tail=True)
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+            count += 1
+            if limit and count >= limit:
+                return
+    parser.close()
+
+
+def _extract_jsonld(doc, types=None) -> Iterator[Dict]:
+    """
+    Yield every object in a page's JSON-LD blocks, with @graph and top-level
+    lists flattened. Accepts a BeautifulSoup document or an lxml tree. With
+    `types`, blocks that don't even mention one of them (breadcrumbs, WebSite,
+    Organization...) are skipped before decoding.
+    """
+    if isinstance(doc, BeautifulSoup):
+        payloads = (script.string for script in doc.find_all("script", type="application/ld+json"))
+    else:
+        payloads = _JSONLD_TEXT(doc)
+    for payload in payloads:
+        if not payload or (types and not any(t in payload for t in types)):
+            continue
+        try:
+            data = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            data = data.get("@graph", [data])
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict):
+                    yield item
+
+
+def iter_jobpostings(doc, types=("JobPosting",)) -> Iterator[Dict]:
+    """Yield the JSON-LD objects of the given @type(s) — JobPosting by default."""
+    for item in _extract_jsonld(doc, types):
+        if item.get("@type") in types:
+            yield item
 
 
 def make_job(title, company, link, source, location="Philippines", salary=None, description="") -> Dict:
+    """
+    Category is left as None: scrape_all detects it once duplicates are gone,
+    using the start of the description carried in "_description".
+    """
     return {
-        "title":    clean(title),
-        "company":  clean(company) or "Not specified",
-        "link":     (link or "").strip(),
-        "category": detect_category(title, description),
-        "location": clean(location) or "Philippines",
-        "salary":   clean(salary) if salary else None,
-        "source":   source,
+        "title":        clean(title),
+        "company":      clean(company) or "Not specified",
+        "link":         (link or "").strip(),
+        "category":     None,
+        "location":     clean(location) or "Philippines",
+        "salary":       clean(salary) if salary else None,
+        "source":       source,
+        "_description": (description or "")[:CATEGORY_DESCRIPTION_CHARS],
     }
 
 
+class JobList(list):
+    """
+    A scraper's results. Links already collected (e.g. the same posting found
+    by several keyword searches) are skipped before a job dict is even built.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.seen = set()
+
+    def _is_new(self, link) -> bool:
+        key = (link or "").strip()
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+    def add(self, title, company, link, *args):
+        """append(make_job(title, company, link, ...)) for links not seen yet."""
+        if self._is_new(link):
+            super().append(make_job(title, company, link, *args))
+
+    def append(self, job: Dict):
+        if self._is_new(job["link"]):
+            super().append(job)
+
+    def extend(self, jobs):
+        for job in jobs:
+            self.append(job)
+
+
+def dig(data, *keys, default=None):
+    """data[k1][k2]... through nested dicts; default as soon as a level is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def _jsonld_salary(base) -> Optional[str]:
+    """Format a JSON-LD baseSalary as "PHP 20,000–30,000" (or "PHP 20,000+" with no max)."""
+    value = dig(base, "value")
+    if not isinstance(value, dict):
+        return None
+    currency = base.get("currency") or "PHP"
+    try:
+        low  = int(float(value["minValue"])) if value.get("minValue") else None
+        high = int(float(value["maxValue"])) if value.get("maxValue") else None
+    except (TypeError, ValueError):
+        return None
+    if low and high:
+        return f"{currency} {low:,}–{high:,}"
+    if low:
+        return f"{currency} {low:,}+"
+    return None
+
+
+def _jobposting_to_record(item: Dict, source: str, default_location="Philippines",
+                          default_company="") -> Optional[Dict]:
+    """make_job() from a JSON-LD JobPosting (or OLX Product); None without a title and link."""
+    title = item.get("title") or item.get("name")
+    link  = item.get("url") or item.get("sameAs")
+    if not (isinstance(title, str) and isinstance(link, str) and title and link):
+        return None
+    company = dig(item, "hiringOrganization", "name")
+    place   = item.get("jobLocation")
+    if isinstance(place, list):
+        place = place[0] if place else None
+    location = dig(place, "address", "addressLocality")
+    return make_job(
+        title,
+        company if isinstance(company, str) and company else default_company,
+        link,
+        source,
+        location if isinstance(location, str) and location else default_location,
+        _jsonld_salary(item.get("baseSalary")),
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  MAIN SCRAPER CLASS
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class JobScraper:
 
-    async def scrape_all(self) -> List[Dict]:
-        """Run all scrapers concurrently and return deduplicated relevant jobs."""
+    def __init__(self):
+        # Scrapers block for tens of seconds; give them their own pool so they
+        # never starve the default executor the bot uses for database calls.
+        self.executor = ThreadPoolExecutor(max_workers=SCRAPER_THREADS, thread_name_prefix="scraper")
+
+    async def scrape_all(self, reuse_pages: bool = False) -> List[Dict]:
+        """
+        Run all scrapers concurrently and return deduplicated relevant jobs.
+        Pages cached by an earlier run are only reused when reuse_pages is set.
+        """
+        if not reuse_pages:
+            forget_pages()
         scrapers = [
             # TIER 1: RSS Feeds & APIs (most reliable)
             (self.scrape_indeed_rss,        "Indeed PH"),
@@ -207,26 +839,45 @@ class JobScraper:
             (self.scrape_telegram_channels, "Telegram PH Jobs"),
         ]
 
-        loop = asyncio.get_event_loop()
-        tasks = [loop.run_in_executor(None, fn) for fn, _ in scrapers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        loop    = asyncio.get_running_loop()
+        elapsed = {}
+
+        async def run(fn, name):
+            started = time.perf_counter()
+            try:
+                return await loop.run_in_executor(self.executor, fn)
+            finally:
+                elapsed[name] = time.perf_counter() - started
+
+        tasks = [asyncio.create_task(run(fn, name), name=f"scrape-{name}") for fn, name in scrapers]
+        _, pending = await asyncio.wait(tasks, timeout=SCRAPE_DEADLINE)
+        for task in pending:
+            task.cancel()  # stop waiting; the worker thread finishes on its own
 
         all_jobs = []
-        for (fn, name), result in zip(scrapers, results):
-            if isinstance(result, Exception):
-                logger.warning(f"❌ {name}: {type(result).__name__}: {result}")
+        for (fn, name), task in zip(scrapers, tasks):
+            if task in pending:
+                logger.warning(f"⏰ {name}: no result after {SCRAPE_DEADLINE}s — skipped this cycle")
+            elif task.exception():
+                error = task.exception()
+                logger.warning(f"❌ {name}: {type(error).__name__}: {error}")
             else:
-                count = len(result) if result else 0
-                logger.info(f"{'✅' if count > 0 else '⚠️ '} {name}: {count} jobs")
+                result = task.result()
+                count  = len(result) if result else 0
+                logger.info(f"{'✅' if count > 0 else '⚠️ '} {name}: {count} jobs in {elapsed[name]:.1f}s")
                 if result:
                     all_jobs.extend(result)
 
-        # Deduplicate by link
+        # Relevance check and dedupe by link in a single pass
         seen, unique = set(), []
         for job in all_jobs:
+            if not is_relevant(job.get("title", "")):
+                continue
             link = job.get("link", "")
             if link and link not in seen:
                 seen.add(link)
+                if job["category"] is None:
+                    job["category"] = detect_category(job["title"], job.pop("_description", ""))
                 unique.append(job)
 
         logger.info(f"📊 Grand total: {len(all_jobs)} scraped → {len(unique)} unique jobs")
@@ -236,7 +887,7 @@ class JobScraper:
     #  1. INDEED PH — RSS (FIXED: namespace was https://, should be http://)
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_indeed_rss(self) -> List[Dict]:
-        jobs = []
+        jobs = JobList()
         searches = [
             "call+center", "BPO+customer+service", "virtual+assistant",
             "work+from+home+Philippines", "POGO+gaming",
@@ -244,53 +895,47 @@ class JobScraper:
             "sales+representative+Philippines", "nurse+Philippines",
             "data+entry+Philippines",
         ]
-        # BUG FIX: Indeed uses http:// (not https://) in their RSS namespace
-        NS_OPTIONS = [
-            "http://www.indeed.com/about/",   # correct
-            "https://www.indeed.com/about/",  # fallback
-        ]
-        session = create_session()
+        session = get_session()
+        headers = get_headers()
 
         for term in searches:
             try:
                 url  = f"https://ph.indeed.com/rss?q={term}&l=Philippines&sort=date&limit=25"
-                resp = session.get(url, headers=get_headers(), timeout=TIMEOUT)
-                resp.raise_for_status()
-                root    = ET.fromstring(resp.content)
-                channel = root.find("channel")
-                if not channel:
-                    continue
-
-                for item in channel.findall("item"):
-                    title = item.findtext("title", "")
-                    link  = item.findtext("link", "")
-                    desc  = item.findtext("description", "")
-
-                    company  = ""
-                    location = "Philippines"
-                    salary   = None
-
-                    # Try both namespaces
-                    for ns in NS_OPTIONS:
-                        company_el = item.find(f"{{{ns}}}company")
-                        if company_el is not None and company_el.text:
-                            company = company_el.text
-                        city_el  = item.find(f"{{{ns}}}city")
-                        state_el = item.find(f"{{{ns}}}state")
-                        city     = city_el.text if city_el is not None else ""
-                        state    = state_el.text if state_el is not None else ""
-                        if city or state:
-                            location = ", ".join(filter(None, [city, state]))
-                        salary_el = item.find(f"{{{ns}}}salary")
-                        if salary_el is not None and salary_el.text:
-                            salary = salary_el.text
-                        if company:
-                            break
+                throttle(url)
+                with session.get(url, headers={**headers, **feed_validators(url)}, timeout=TIMEOUT, stream=True) as resp:
+                    cached = cached_feed_jobs(url, resp)
+                    if cached is not None:
+                        jobs.extend(cached)
+                        continue
+                    resp.raise_for_status()
+                    start = len(jobs)
+                    feed_tags = None  # the namespace this feed uses, found on its first company tag
+                    for item in iter_rss_items(resp):
+                        # One walk over the item's children instead of a find() per field
+                        fields = {}
+                        for child in item:
+                            fields.setdefault(child.tag, child.text)
+                        title = fields.get("title") or ""
+                        link  = fields.get("link") or ""
+                        desc  = fields.get("description") or ""
+
+                        if feed_tags is None:
+                            feed_tags = next((tags for tags in INDEED_TAGS if fields.get(tags[0])), None)
+                        company_tag, city_tag, state_tag, salary_tag = feed_tags or INDEED_TAGS[0]
+
+                        company = fields.get(company_tag) or ""
+                        salary  = fields.get(salary_tag) or None
+                        city    = fields.get(city_tag) or ""
+                        state   = fields.get(state_tag) or ""
+                        if city and state:
+                            location = f"{city}, {state}"
+                        else:
+                            location = city or state or "Philippines"
 
-                    if title and link:
-                        jobs.append(make_job(title, company, link, "Indeed PH", location, salary, desc))
+                        if title and link:
+                            jobs.add(title, company, link, "Indeed PH", location, salary, desc)
 
-                time.sleep(0.5)
+                    remember_feed(url, resp, jobs[start:])
             except Exception as e:
                 logger.debug(f"Indeed RSS '{term}': {e}")
 
@@ -300,15 +945,15 @@ class JobScraper:
     #  2. REMOTEOK — JSON API (Very Reliable)
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_remoteok_api(self) -> List[Dict]:
-        jobs = []
+        jobs = JobList()
         try:
-            resp = requests.get(
+            resp = get_session().get(
                 "https://remoteok.com/api",
                 headers=get_headers({"Accept": "application/json"}),
                 timeout=TIMEOUT,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             for job in data[1:] if isinstance(data, list) else []:
                 title   = job.get("position", "")
@@ -326,7 +971,7 @@ class JobScraper:
                     salary = f"${int(sal_min):,}+/yr"
 
                 if title and link and is_relevant(title, tags + " " + desc):
-                    jobs.append(make_job(title, company, link, "RemoteOK", "Remote (Worldwide)", salary, desc))
+                    jobs.add(title, company, link, "RemoteOK", "Remote (Worldwide)", salary, desc)
 
         except Exception as e:
             logger.debug(f"RemoteOK API: {e}")
@@ -337,46 +982,50 @@ class JobScraper:
     #  3. JOOBLE — API with scrape fallback
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_jooble(self) -> List[Dict]:
-        API_KEY = os.environ.get("JOOBLE_API_KEY", "")
-        jobs    = []
-        terms   = ["call center", "virtual assistant", "BPO", "work from home", "customer service"]
-        session = create_session()
-
-        for term in terms:
-            try:
-                if API_KEY:
-                    resp = requests.post(
-                        f"https://jooble.org/api/{API_KEY}",
+        jobs = JobList()
+
+        if JOOBLE_API_KEY:
+            session = get_session()
+            for term, _ in JOOBLE_TERMS:
+                try:
+                    throttle("https://jooble.org/api")
+                    resp = session.post(
+                        f"https://jooble.org/api/{JOOBLE_API_KEY}",
                         json={"keywords": term, "location": "Philippines", "page": 1},
                         headers={"Content-Type": "application/json"},
                         timeout=TIMEOUT,
                     )
-                    for j in resp.json().get("jobs", []):
-                        jobs.append(make_job(
+                    for j in orjson.loads(resp.content).get("jobs", []):
+                        jobs.add(
                             j.get("title", ""), j.get("company", ""), j.get("link", ""),
                             "Jooble", j.get("location", "Philippines"),
                             j.get("salary") or None, j.get("snippet", ""),
-                        ))
-                else:
-                    url  = f"https://ph.jooble.org/SearchResult?ukw={term.replace(' ', '+')}"
-                    resp = session.get(url, headers=get_headers(), timeout=TIMEOUT)
-                    if resp.status_code == 403:
+                        )
+                except Exception as e:
+                    logger.debug(f"Jooble '{term}': {e}")
+            return jobs
+
+        urls = [f"https://ph.jooble.org/SearchResult?ukw={term_enc}" for _, term_enc in JOOBLE_TERMS]
+        for (term, _), resp in zip(JOOBLE_TERMS, fetch_all(urls)):
+            if resp is None:
+                continue
+            try:
+                if resp.status_code == 403:
+                    continue
+                tree = html_tree(resp)
+                for card in _ARTICLES(tree)[:15]:
+                    title_el = first(_HEADING_XP, card)
+                    if title_el is None:
                         continue
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for card in soup.find_all("article")[:15]:
-                        title_el = card.find(["h2", "h3"])
-                        if not title_el:
-                            continue
-                        title = title_el.get_text(strip=True)
-                        a_el  = card.find("a", href=True)
-                        link  = a_el["href"] if a_el else ""
-                        if link and not link.startswith("http"):
-                            link = "https://ph.jooble.org" + link
-                        comp_el = card.find(class_=re.compile(r"company|employer", re.I))
-                        company = comp_el.get_text(strip=True) if comp_el else ""
-                        if title and link:
-                            jobs.append(make_job(title, company, link, "Jooble"))
-                time.sleep(0.5)
+                    title = node_text(title_el)
+                    a_el  = first(_LINK_XP, card)
+                    link  = a_el.get("href") if a_el is not None else ""
+                    if link and not link.startswith("http"):
+                        link = "https://ph.jooble.org" + link
+                    comp_el = first(_COMPANY_XP, card)
+                    company = node_text(comp_el) if comp_el is not None else ""
+                    if title and link:
+                        jobs.add(title, company, link, "Jooble")
             except Exception as e:
                 logger.debug(f"Jooble '{term}': {e}")
 
@@ -387,8 +1036,9 @@ class JobScraper:
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_philjobnet(self) -> List[Dict]:
         """BUG FIXED: Old RSS paths /rss/jobs and /rss/latest didn't exist."""
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
+        session = get_session()
+        headers = get_headers()
 
         # FIXED: Correct PhilJobNet RSS URL formats
         rss_urls = [
@@ -399,59 +1049,62 @@ class JobScraper:
 
         for url in rss_urls:
             try:
-                resp = session.get(url, headers=get_headers(), timeout=TIMEOUT, verify=False)
-                if resp.status_code != 200:
-                    continue
-                root    = ET.fromstring(resp.content)
-                channel = root.find("channel")
-                if not channel:
-                    continue
-
-                for item in channel.findall("item")[:40]:
-                    title = item.findtext("title", "")
-                    link  = item.findtext("link", "")
-                    desc  = item.findtext("description", "")
-                    if not (title and link) or not is_relevant(title, desc):
+                throttle(url)
+                with session.get(url, headers={**headers, **feed_validators(url)}, timeout=TIMEOUT, verify=False, stream=True) as resp:
+                    cached = cached_feed_jobs(url, resp)
+                    if cached is not None:
+                        jobs.extend(cached)
+                        if jobs:
+                            break
                         continue
-                    soup     = BeautifulSoup(desc, "html.parser")
-                    text     = soup.get_text()
-                    company  = ""
-                    location = "Philippines"
-                    m = re.search(r"(?:Company|Employer):\s*(.+?)(?:\n|<)", text)
-                    if m:
-                        company = m.group(1).strip()
-                    m2 = re.search(r"(?:Location|Address|City):\s*(.+?)(?:\n|<)", text)
-                    if m2:
-                        location = m2.group(1).strip()
-                    jobs.append(make_job(title, company, link, "PhilJobNet", location))
-
-                if jobs:
-                    break
+                    if resp.status_code != 200:
+                        continue
+                    for item in iter_rss_items(resp, limit=40):
+                        title = item.findtext("title", "")
+                        link  = item.findtext("link", "")
+                        desc  = item.findtext("description", "")
+                        if not (title and link) or not is_relevant(title, desc):
+                            continue
+                        soup     = BeautifulSoup(desc, HTML_PARSER)
+                        text     = soup.get_text()
+                        company  = ""
+                        location = "Philippines"
+                        m = _PHILJOBNET_COMPANY_RE.search(text)
+                        if m:
+                            company = m.group(1).strip()
+                        m2 = _PHILJOBNET_LOCATION_RE.search(text)
+                        if m2:
+                            location = m2.group(1).strip()
+                        jobs.add(title, company, link, "PhilJobNet", location)
+
+                    remember_feed(url, resp, jobs)
+                    if jobs:
+                        break
             except Exception as e:
                 logger.debug(f"PhilJobNet RSS '{url}': {e}")
 
         # Fallback: web scrape
         if not jobs:
             try:
-                for kw in ["call center", "virtual assistant", "BPO", "nursing"]:
-                    url  = f"https://www.philjobnet.gov.ph/index.php?option=com_philjobnet&view=vacancies&task=search&q={kw.replace(' ', '+')}"
-                    resp = session.get(url, headers=get_headers(), timeout=TIMEOUT)
+                for url in PHILJOBNET_SEARCH_URLS:
+                    throttle(url)
+                    resp = get_page(session, url, headers)
                     if resp.status_code != 200:
                         continue
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                    for row in soup.find_all(["div", "tr"], class_=re.compile(r"vacancy|job|result", re.I))[:10]:
-                        a = row.find("a", href=True)
-                        if not a:
+                    tree = html_tree(resp)
+                    for row in _PHILJOBNET_ROWS(tree)[:10]:
+                        a = first(_LINK_XP, row)
+                        if a is None:
                             continue
-                        title = a.get_text(strip=True)
-                        link  = a["href"]
+                        title = node_text(a)
+                        link  = a.get("href")
                         if not link.startswith("http"):
                             link = "https://www.philjobnet.gov.ph" + link
-                        tds      = row.find_all("td")
-                        company  = tds[1].get_text(strip=True) if len(tds) > 1 else ""
-                        location = tds[2].get_text(strip=True) if len(tds) > 2 else "Philippines"
+                        tds      = _TD_XP(row)
+                        company  = node_text(tds[1]) if len(tds) > 1 else ""
+                        location = node_text(tds[2]) if len(tds) > 2 else "Philippines"
                         if title and is_relevant(title):
-                            jobs.append(make_job(title, company, link, "PhilJobNet", location))
+                            jobs.add(title, company, link, "PhilJobNet", location)
             except Exception as e:
                 logger.debug(f"PhilJobNet scrape fallback: {e}")
 
@@ -469,8 +1122,8 @@ class JobScraper:
         - Tries both the jobs-guest API and regular search page
         - Extracts JSON-LD in addition to DOM scraping
         """
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
+        session = get_session()
 
         linkedin_headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -488,46 +1141,27 @@ class JobScraper:
 
         # Pre-visit to get cookies
         try:
+            throttle("https://www.linkedin.com/")
             session.get("https://www.linkedin.com/", headers=linkedin_headers, timeout=TIMEOUT)
-            time.sleep(1.5)
         except Exception:
             pass
 
-        searches = [
-            ("call center agent", "Philippines"),
-            ("virtual assistant", "Philippines"),
-            ("BPO customer service", "Philippines"),
-            ("work from home Philippines", ""),
-            ("accounting remote Philippines", ""),
-            ("IT support Philippines", ""),
-        ]
-
         blocked = False
-        for keywords, location in searches:
+        for keywords, url, url2 in LINKEDIN_SEARCHES:
             if blocked:
                 break
             try:
-                kw_enc  = requests.utils.quote(keywords)
-                loc_enc = requests.utils.quote(location)
-
                 # Try the public guest API first
-                url = (
-                    f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?"
-                    f"keywords={kw_enc}&location={loc_enc}&f_TPR=r86400&sortBy=DD&start=0"
-                )
-                resp = session.get(url, headers=linkedin_headers, timeout=TIMEOUT)
+                throttle(url)
+                resp = get_page(session, url, linkedin_headers)
 
                 # If blocked, try the regular search page
                 if resp.status_code == 999 or resp.status_code == 429:
-                    url2 = (
-                        f"https://www.linkedin.com/jobs/search?"
-                        f"keywords={kw_enc}&location={loc_enc}&f_TPR=r86400&sortBy=DD"
-                    )
-                    resp = session.get(url2, headers=linkedin_headers, timeout=TIMEOUT)
+                    throttle(url2)
+                    resp = get_page(session, url2, linkedin_headers)
 
                 if resp.status_code not in (200, 201):
                     logger.debug(f"LinkedIn '{keywords}': HTTP {resp.status_code}")
-                    time.sleep(2)
                     continue
 
                 # Detect authwall — stop trying if hit
@@ -536,53 +1170,36 @@ class JobScraper:
                     blocked = True
                     break
 
-                soup = BeautifulSoup(resp.text, "html.parser")
+                tree = html_tree(resp)
 
                 # Check if we got a login page
-                if soup.find("form", id="login"):
+                if _LOGIN_FORM(tree):
                     logger.info("LinkedIn: Got login form — stopping")
                     blocked = True
                     break
 
                 # JSON-LD extraction
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") == "JobPosting":
-                                title   = item.get("title", "")
-                                company = item.get("hiringOrganization", {}).get("name", "")
-                                link    = item.get("url", "")
-                                loc_raw = item.get("jobLocation", {})
-                                loc_str = "Philippines"
-                                if isinstance(loc_raw, dict):
-                                    loc_str = loc_raw.get("address", {}).get("addressLocality", "Philippines")
-                                if title and link:
-                                    jobs.append(make_job(title, company, link, "LinkedIn", loc_str))
-                    except Exception:
-                        pass
+                for item in iter_jobpostings(tree):
+                    job = _jobposting_to_record(item, "LinkedIn")
+                    if job:
+                        jobs.append(job)
 
                 # DOM scraping
-                cards = (
-                    soup.find_all("div", class_=re.compile(r"base-card|job-search-card|job-card", re.I))
-                    or soup.find_all("li", class_=re.compile(r"result-card|jobs-search-results__list-item", re.I))
-                )
+                cards = _LINKEDIN_CARDS(tree) or _LINKEDIN_ITEMS(tree)
                 for card in cards[:10]:
-                    title_el = card.find("h3") or card.find("h2") or card.find(class_=re.compile(r"job-title|position", re.I))
-                    if not title_el:
+                    title_el = first_of(card, _H3_XP, _H2_XP, _TITLE_XP)
+                    if title_el is None:
                         continue
-                    title   = title_el.get_text(strip=True)
-                    a_el    = card.find("a", href=True)
-                    link    = a_el["href"].split("?")[0] if a_el else ""
-                    comp_el = card.find(class_=re.compile(r"company|subtitle", re.I)) or card.find("h4")
-                    company = comp_el.get_text(strip=True) if comp_el else ""
-                    loc_el  = card.find(class_=re.compile(r"location|locale", re.I))
-                    job_loc = loc_el.get_text(strip=True) if loc_el else "Philippines"
+                    title   = node_text(title_el)
+                    a_el    = first(_LINK_XP, card)
+                    link    = a_el.get("href").split("?")[0] if a_el is not None else ""
+                    comp_el = first_of(card, _SUBTITLE_XP, _H4_XP)
+                    company = node_text(comp_el) if comp_el is not None else ""
+                    loc_el  = first(_LOCALE_XP, card)
+                    job_loc = node_text(loc_el) if loc_el is not None else "Philippines"
                     if title and link and "linkedin.com" in link:
-                        jobs.append(make_job(title, company, link, "LinkedIn", job_loc))
+                        jobs.add(title, company, link, "LinkedIn", job_loc)
 
-                time.sleep(2.0)  # LinkedIn needs a long delay
             except Exception as e:
                 logger.debug(f"LinkedIn '{keywords}': {e}")
 
@@ -592,16 +1209,17 @@ class JobScraper:
     #  6. JOBSTREET PH — Session-based with pre-visit cookies
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_jobstreet(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
+        session = get_session()
 
         # Pre-visit to get session cookies — reduces 403s
         try:
+            throttle("https://www.jobstreet.com.ph/")
             session.get("https://www.jobstreet.com.ph/", headers=get_headers(), timeout=TIMEOUT)
-            time.sleep(0.8)
         except Exception:
             pass
 
+        headers = get_headers({"Referer": "https://www.jobstreet.com.ph/"})
         pages = [
             "https://www.jobstreet.com.ph/call-center-jobs",
             "https://www.jobstreet.com.ph/bpo-jobs",
@@ -615,70 +1233,46 @@ class JobScraper:
 
         for url in pages:
             try:
-                resp = session.get(url, headers=get_headers({"Referer": "https://www.jobstreet.com.ph/"}), timeout=TIMEOUT)
+                throttle(url)
+                resp = get_page(session, url, headers)
                 if resp.status_code == 403:
-                    time.sleep(1)
                     continue
 
-                soup  = BeautifulSoup(resp.text, "html.parser")
+                soup  = html_soup(resp, SCRIPTS_ONLY)
                 found = False
 
                 # Method 1: JSON-LD
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") != "JobPosting":
-                                continue
-                            title   = item.get("title", "")
-                            company = item.get("hiringOrganization", {}).get("name", "")
-                            link    = item.get("url") or item.get("sameAs", "")
-                            loc_raw = item.get("jobLocation", {})
-                            location = "Philippines"
-                            if isinstance(loc_raw, dict):
-                                location = loc_raw.get("address", {}).get("addressLocality", "Philippines")
-                            sal_data = item.get("baseSalary", {})
-                            salary = None
-                            if isinstance(sal_data, dict):
-                                val  = sal_data.get("value", {})
-                                curr = sal_data.get("currency", "PHP")
-                                if isinstance(val, dict):
-                                    mn = val.get("minValue")
-                                    mx = val.get("maxValue")
-                                    if mn and mx:
-                                        salary = f"{curr} {int(mn):,}–{int(mx):,}"
-                            if title and link:
-                                jobs.append(make_job(title, company, link, "JobStreet PH", location, salary))
-                                found = True
-                    except Exception:
-                        pass
+                for item in iter_jobpostings(soup):
+                    job = _jobposting_to_record(item, "JobStreet PH")
+                    if job:
+                        jobs.append(job)
+                        found = True
 
                 # Method 2: __NEXT_DATA__
                 if not found:
                     next_data = soup.find("script", id="__NEXT_DATA__")
                     if next_data:
                         try:
-                            data       = json.loads(next_data.string or "{}")
-                            page_props = data.get("props", {}).get("pageProps", {})
+                            data       = orjson.loads(next_data.string or "{}")
+                            page_props = dig(data, "props", "pageProps")
                             job_list   = (
-                                page_props.get("jobSearchResult", {}).get("jobs", [])
-                                or page_props.get("jobs", [])
-                                or page_props.get("initialData", {}).get("jobs", [])
+                                dig(page_props, "jobSearchResult", "jobs")
+                                or dig(page_props, "jobs")
+                                or dig(page_props, "initialData", "jobs")
+                                or []
                             )
                             for j in job_list[:15]:
                                 title   = j.get("title", "") or (j.get("roleTitles") or [""])[0]
-                                company = j.get("companyName", "") or j.get("advertiser", {}).get("description", "")
+                                company = j.get("companyName") or dig(j, "advertiser", "description", default="")
                                 job_id  = j.get("id", "")
                                 link    = f"https://www.jobstreet.com.ph/job/{job_id}" if job_id else ""
-                                loc_l   = j.get("locationWhereYouCanWork", [{}])
-                                location = loc_l[0].get("label", "Philippines") if loc_l else "Philippines"
+                                loc_l   = j.get("locationWhereYouCanWork")
+                                location = dig(loc_l[0], "label", default="Philippines") if loc_l else "Philippines"
                                 if title and link:
-                                    jobs.append(make_job(title, company, link, "JobStreet PH", location))
+                                    jobs.add(title, company, link, "JobStreet PH", location)
                         except Exception:
                             pass
 
-                time.sleep(1.0)
             except Exception as e:
                 logger.debug(f"JobStreet '{url}': {e}")
 
@@ -688,51 +1282,41 @@ class JobScraper:
     #  7. ONLINEJOBS.PH
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_onlinejobs(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
         searches = [
             "virtual-assistant", "data-entry", "customer-service",
             "social-media", "bookkeeper", "content-writer", "graphic-designer",
         ]
 
-        for kw in searches:
+        urls = [f"https://www.onlinejobs.ph/jobseekers/joblist/1?keyword={kw}&jobtype=1&category=0" for kw in searches]
+        for kw, resp in zip(searches, fetch_all(urls)):
+            if resp is None:
+                continue
             try:
-                url  = f"https://www.onlinejobs.ph/jobseekers/joblist/1?keyword={kw}&jobtype=1&category=0"
-                resp = session.get(url, headers=get_headers(), timeout=TIMEOUT)
                 if resp.status_code == 403:
                     continue
-                soup = BeautifulSoup(resp.text, "html.parser")
+                tree = html_tree(resp)
 
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") == "JobPosting":
-                                title   = item.get("title", "")
-                                company = item.get("hiringOrganization", {}).get("name", "Remote Employer")
-                                link    = item.get("url", "")
-                                if title and link:
-                                    jobs.append(make_job(title, company, link, "OnlineJobs.ph", "Philippines (Remote)"))
-                    except Exception:
-                        pass
+                for item in iter_jobpostings(tree):
+                    job = _jobposting_to_record(item, "OnlineJobs.ph", "Philippines (Remote)", "Remote Employer")
+                    if job:
+                        jobs.append(job)
 
-                for card in soup.find_all("div", class_=re.compile(r"job.?post|jobpost|job.?row", re.I))[:12]:
-                    a = card.find("a", href=True)
-                    if not a:
+                for card in _ONLINEJOBS_CARDS(tree)[:12]:
+                    a = first(_LINK_XP, card)
+                    if a is None:
                         continue
-                    title = a.get_text(strip=True)
-                    link  = a["href"]
+                    title = node_text(a)
+                    link  = a.get("href")
                     if not link.startswith("http"):
                         link = "https://www.onlinejobs.ph" + link
-                    comp_el = card.find(class_=re.compile(r"company|employer|client", re.I))
-                    company = comp_el.get_text(strip=True) if comp_el else "Remote Employer"
-                    rate_el = card.find(class_=re.compile(r"rate|salary|pay", re.I))
-                    salary  = rate_el.get_text(strip=True) if rate_el else None
+                    comp_el = first(_CLIENT_XP, card)
+                    company = node_text(comp_el) if comp_el is not None else "Remote Employer"
+                    rate_el = first(_RATE_XP, card)
+                    salary  = node_text(rate_el) if rate_el is not None else None
                     if title and link:
-                        jobs.append(make_job(title, company, link, "OnlineJobs.ph", "Philippines (Remote)", salary))
+                        jobs.add(title, company, link, "OnlineJobs.ph", "Philippines (Remote)", salary)
 
-                time.sleep(0.5)
             except Exception as e:
                 logger.debug(f"OnlineJobs '{kw}': {e}")
 
@@ -742,60 +1326,48 @@ class JobScraper:
     #  8. KALIBRR — Session + __NEXT_DATA__ fallback
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_kalibrr(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
+        session = get_session()
 
         try:
+            throttle("https://www.kalibrr.com/")
             session.get("https://www.kalibrr.com/", headers=get_headers(), timeout=TIMEOUT)
-            time.sleep(0.5)
         except Exception:
             pass
 
+        headers  = get_headers({"Referer": "https://www.kalibrr.com/"})
         searches = ["call+center", "virtual+assistant", "BPO", "customer+service", "work+from+home"]
 
         for kw in searches:
             try:
                 url  = f"https://www.kalibrr.com/job-board/te/philippines?q={kw}&sort=recent"
-                resp = session.get(url, headers=get_headers({"Referer": "https://www.kalibrr.com/"}), timeout=TIMEOUT)
+                throttle(url)
+                resp = get_page(session, url, headers)
                 if resp.status_code == 403:
                     continue
-                soup = BeautifulSoup(resp.text, "html.parser")
+                soup = html_soup(resp, SCRIPTS_ONLY)
 
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") == "JobPosting":
-                                title   = item.get("title", "")
-                                company = item.get("hiringOrganization", {}).get("name", "")
-                                link    = item.get("url", "")
-                                loc_raw = item.get("jobLocation", {})
-                                location = "Philippines"
-                                if isinstance(loc_raw, dict):
-                                    location = loc_raw.get("address", {}).get("addressLocality", "Philippines")
-                                if title and link:
-                                    jobs.append(make_job(title, company, link, "Kalibrr", location))
-                    except Exception:
-                        pass
+                for item in iter_jobpostings(soup):
+                    job = _jobposting_to_record(item, "Kalibrr")
+                    if job:
+                        jobs.append(job)
 
                 next_data = soup.find("script", id="__NEXT_DATA__")
                 if next_data:
                     try:
-                        data     = json.loads(next_data.string or "{}")
-                        job_list = data.get("props", {}).get("pageProps", {}).get("jobs", [])
+                        data     = orjson.loads(next_data.string or "{}")
+                        job_list = dig(data, "props", "pageProps", "jobs") or []
                         for j in job_list[:10]:
                             title   = j.get("title", "")
-                            company = j.get("company", {}).get("name", "")
+                            company = dig(j, "company", "name", default="")
                             job_id  = j.get("id", "")
-                            c_code  = j.get("company", {}).get("code", "")
+                            c_code  = dig(j, "company", "code", default="")
                             link    = f"https://www.kalibrr.com/c/{c_code}/jobs/{job_id}" if job_id else ""
                             if title and link:
-                                jobs.append(make_job(title, company, link, "Kalibrr"))
+                                jobs.add(title, company, link, "Kalibrr")
                     except Exception:
                         pass
 
-                time.sleep(0.5)
             except Exception as e:
                 logger.debug(f"Kalibrr '{kw}': {e}")
 
@@ -805,42 +1377,23 @@ class JobScraper:
     #  9. BOSSJOB PH
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_bossjob(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
         searches = ["call+center", "virtual+assistant", "customer+service", "bpo"]
 
-        for kw in searches:
+        urls = [f"https://ph.bossjob.com/jobs?search={kw}&sort=latest" for kw in searches]
+        for kw, resp in zip(searches, fetch_all(urls)):
+            if resp is None:
+                continue
             try:
-                url  = f"https://ph.bossjob.com/jobs?search={kw}&sort=latest"
-                resp = session.get(url, headers=get_headers(), timeout=TIMEOUT)
                 if resp.status_code == 403:
                     continue
-                soup = BeautifulSoup(resp.text, "html.parser")
+                soup = html_soup(resp, JSONLD_ONLY)
 
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") == "JobPosting":
-                                title   = item.get("title", "")
-                                company = item.get("hiringOrganization", {}).get("name", "")
-                                link    = item.get("url", "")
-                                sal_data = item.get("baseSalary", {})
-                                salary = None
-                                if isinstance(sal_data, dict):
-                                    val = sal_data.get("value", {})
-                                    if isinstance(val, dict):
-                                        mn = val.get("minValue")
-                                        mx = val.get("maxValue")
-                                        if mn:
-                                            salary = f"PHP {int(mn):,}–{int(mx):,}" if mx else f"PHP {int(mn):,}+"
-                                if title and link:
-                                    jobs.append(make_job(title, company, link, "BossJob PH", "Philippines", salary))
-                    except Exception:
-                        pass
+                for item in iter_jobpostings(soup):
+                    job = _jobposting_to_record(item, "BossJob PH")
+                    if job:
+                        jobs.append(job)
 
-                time.sleep(0.5)
             except Exception as e:
                 logger.debug(f"BossJob '{kw}': {e}")
 
@@ -851,8 +1404,9 @@ class JobScraper:
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_trabaho(self) -> List[Dict]:
         """BUG FIXED: Try multiple URL formats since trabaho.ph may have changed."""
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
+        session = get_session()
+        headers = get_headers()
         searches = ["call-center", "virtual-assistant", "bpo", "work-from-home", "customer-service"]
 
         for kw in searches:
@@ -866,7 +1420,8 @@ class JobScraper:
                 resp = None
                 for url in urls_to_try:
                     try:
-                        r = session.get(url, headers=get_headers(), timeout=TIMEOUT)
+                        throttle(url)
+                        r = get_page(session, url, headers)
                         if r.status_code == 200:
                             resp = r
                             break
@@ -876,39 +1431,29 @@ class JobScraper:
                 if not resp:
                     continue
 
-                soup = BeautifulSoup(resp.text, "html.parser")
+                tree = html_tree(resp)
 
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") == "JobPosting":
-                                title   = item.get("title", "")
-                                company = item.get("hiringOrganization", {}).get("name", "")
-                                link    = item.get("url", "")
-                                if title and link:
-                                    jobs.append(make_job(title, company, link, "Trabaho.ph"))
-                    except Exception:
-                        pass
+                for item in iter_jobpostings(tree):
+                    job = _jobposting_to_record(item, "Trabaho.ph")
+                    if job:
+                        jobs.append(job)
 
-                for card in soup.find_all("div", class_=re.compile(r"job.?item|job.?listing|vacancy|job.?card", re.I))[:10]:
-                    title_el = card.find(["h2", "h3", "a"])
-                    if not title_el:
+                for card in _TRABAHO_CARDS(tree)[:10]:
+                    title_el = first(_HEADING_OR_LINK_XP, card)
+                    if title_el is None:
                         continue
-                    title = title_el.get_text(strip=True)
-                    a_el  = card.find("a", href=True)
-                    link  = a_el["href"] if a_el else ""
+                    title = node_text(title_el)
+                    a_el  = first(_LINK_XP, card)
+                    link  = a_el.get("href") if a_el is not None else ""
                     if link and not link.startswith("http"):
                         link = "https://trabaho.ph" + link
-                    comp_el  = card.find(class_=re.compile(r"company|employer", re.I))
-                    company  = comp_el.get_text(strip=True) if comp_el else ""
-                    loc_el   = card.find(class_=re.compile(r"location|city", re.I))
-                    location = loc_el.get_text(strip=True) if loc_el else "Philippines"
+                    comp_el  = first(_COMPANY_XP, card)
+                    company  = node_text(comp_el) if comp_el is not None else ""
+                    loc_el   = first(_CITY_XP, card)
+                    location = node_text(loc_el) if loc_el is not None else "Philippines"
                     if title and link and is_relevant(title):
-                        jobs.append(make_job(title, company, link, "Trabaho.ph", location))
+                        jobs.add(title, company, link, "Trabaho.ph", location)
 
-                time.sleep(0.5)
             except Exception as e:
                 logger.debug(f"Trabaho '{kw}': {e}")
 
@@ -918,42 +1463,24 @@ class JobScraper:
     #  11. GLASSDOOR PH
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_glassdoor(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
         searches = ["call-center", "virtual-assistant", "BPO", "customer-service"]
 
-        for kw in searches:
+        urls = [
+            f"https://www.glassdoor.com/Job/philippines-{kw}-jobs-SRCH_IL.0,11_IN194_KO12,{12+len(kw)}.htm?sortBy=date_desc"
+            for kw in searches
+        ]
+        for kw, resp in zip(searches, fetch_all(urls, {"Referer": "https://www.glassdoor.com/"})):
+            if resp is None:
+                continue
             try:
-                kw_len = len(kw)
-                url  = f"https://www.glassdoor.com/Job/philippines-{kw}-jobs-SRCH_IL.0,11_IN194_KO12,{12+kw_len}.htm?sortBy=date_desc"
-                resp = session.get(url, headers=get_headers({"Referer": "https://www.glassdoor.com/"}), timeout=TIMEOUT)
                 if resp.status_code in (403, 429):
                     continue
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") == "JobPosting":
-                                title   = item.get("title", "")
-                                company = item.get("hiringOrganization", {}).get("name", "")
-                                link    = item.get("url", "")
-                                sal_data = item.get("baseSalary", {})
-                                salary = None
-                                if isinstance(sal_data, dict):
-                                    val  = sal_data.get("value", {})
-                                    curr = sal_data.get("currency", "PHP")
-                                    if isinstance(val, dict):
-                                        mn = val.get("minValue")
-                                        mx = val.get("maxValue")
-                                        if mn and mx:
-                                            salary = f"{curr} {int(mn):,}–{int(mx):,}"
-                                if title and link:
-                                    jobs.append(make_job(title, company, link, "Glassdoor PH", "Philippines", salary))
-                    except Exception:
-                        pass
-                time.sleep(1.0)
+                soup = html_soup(resp, JSONLD_ONLY)
+                for item in iter_jobpostings(soup):
+                    job = _jobposting_to_record(item, "Glassdoor PH")
+                    if job:
+                        jobs.append(job)
             except Exception as e:
                 logger.debug(f"Glassdoor '{kw}': {e}")
         return jobs
@@ -962,8 +1489,9 @@ class JobScraper:
     #  12. MONSTER PH — Tries both .com.ph and .com
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_monster(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
+        session = get_session()
+        headers = get_headers()
         searches = ["call-center", "virtual-assistant", "bpo", "customer-service"]
 
         for kw in searches:
@@ -975,7 +1503,8 @@ class JobScraper:
                 resp = None
                 for url in urls:
                     try:
-                        r = session.get(url, headers=get_headers(), timeout=TIMEOUT)
+                        throttle(url)
+                        r = get_page(session, url, headers)
                         if r.status_code == 200:
                             resp = r
                             break
@@ -985,35 +1514,25 @@ class JobScraper:
                 if not resp:
                     continue
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") == "JobPosting":
-                                title   = item.get("title", "")
-                                company = item.get("hiringOrganization", {}).get("name", "")
-                                link    = item.get("url", "")
-                                if title and link:
-                                    jobs.append(make_job(title, company, link, "Monster PH"))
-                    except Exception:
-                        pass
+                tree = html_tree(resp)
+                for item in iter_jobpostings(tree):
+                    job = _jobposting_to_record(item, "Monster PH")
+                    if job:
+                        jobs.append(job)
 
-                for card in soup.find_all("div", class_=re.compile(r"job.?card|job-summary|result", re.I))[:12]:
-                    title_el = card.find(["h2", "h3", "a"])
-                    if not title_el:
+                for card in _MONSTER_CARDS(tree)[:12]:
+                    title_el = first(_HEADING_OR_LINK_XP, card)
+                    if title_el is None:
                         continue
-                    title = title_el.get_text(strip=True)
-                    a_el  = card.find("a", href=True)
-                    link  = a_el["href"] if a_el else ""
+                    title = node_text(title_el)
+                    a_el  = first(_LINK_XP, card)
+                    link  = a_el.get("href") if a_el is not None else ""
                     if link and not link.startswith("http"):
                         link = "https://www.monster.com.ph" + link
-                    comp_el = card.find(class_=re.compile(r"company|employer|name", re.I))
-                    company = comp_el.get_text(strip=True) if comp_el else ""
+                    comp_el = first(_NAME_XP, card)
+                    company = node_text(comp_el) if comp_el is not None else ""
                     if title and link and is_relevant(title):
-                        jobs.append(make_job(title, company, link, "Monster PH"))
-                time.sleep(0.5)
+                        jobs.add(title, company, link, "Monster PH")
             except Exception as e:
                 logger.debug(f"Monster '{kw}': {e}")
         return jobs
@@ -1023,8 +1542,9 @@ class JobScraper:
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_upwork(self) -> List[Dict]:
         """BUG FIXED: Upwork RSS URL format updated. Added fallback to search page."""
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
+        session = get_session()
+        headers = get_headers({"Accept": "application/rss+xml, application/xml, text/xml, */*"})
         rss_searches = [
             "virtual+assistant", "customer+service", "data+entry",
             "social+media+manager", "bookkeeper", "content+writer",
@@ -1041,10 +1561,9 @@ class JobScraper:
                 resp = None
                 for rss_url in rss_urls:
                     try:
-                        r = session.get(rss_url, headers=get_headers({
-                            "Accept": "application/rss+xml, application/xml, text/xml, */*",
-                        }), timeout=TIMEOUT)
-                        if r.status_code == 200 and ("<rss" in r.text[:500] or "<feed" in r.text[:500]):
+                        throttle(rss_url)
+                        r = session.get(rss_url, headers=headers, timeout=TIMEOUT)
+                        if r.status_code == 200 and (b"<rss" in r.content[:500] or b"<feed" in r.content[:500]):
                             resp = r
                             break
                     except Exception:
@@ -1053,20 +1572,16 @@ class JobScraper:
                 if not resp:
                     continue
 
-                root    = ET.fromstring(resp.content)
-                channel = root.find("channel") or root
-                items   = channel.findall("item")
-                for item in items[:15]:
+                for item in iter_rss_items(resp, limit=15):
                     title = item.findtext("title", "")
                     link  = item.findtext("link", "")
                     desc  = item.findtext("description", "")
                     if title and link and is_relevant(title, desc):
                         salary = None
-                        m = re.search(r"Budget:\s*\$?([\d,]+(?:\s*[-–]\s*\$?[\d,]+)?)", desc)
+                        m = _UPWORK_BUDGET_RE.search(desc)
                         if m:
                             salary = f"${m.group(1)}"
-                        jobs.append(make_job(title, "Upwork Client", link, "Upwork", "Remote (Worldwide)", salary, desc))
-                time.sleep(0.5)
+                        jobs.add(title, "Upwork Client", link, "Upwork", "Remote (Worldwide)", salary, desc)
             except Exception as e:
                 logger.debug(f"Upwork RSS '{term}': {e}")
         return jobs
@@ -1076,8 +1591,10 @@ class JobScraper:
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_freelancer(self) -> List[Dict]:
         """BUG FIXED: Freelancer.com RSS URL format updated with web scrape fallback."""
-        jobs    = []
-        session = create_session()
+        jobs        = JobList()
+        session     = get_session()
+        headers     = get_headers()
+        rss_headers = {**headers, "Accept": "application/rss+xml, application/xml, text/xml"}
         searches = ["virtual-assistant", "customer-service", "data-entry", "social-media", "content-writing"]
 
         for kw in searches:
@@ -1089,47 +1606,44 @@ class JobScraper:
                 resp = None
                 for rss_url in rss_urls:
                     try:
-                        r = session.get(rss_url, headers=get_headers({
-                            "Accept": "application/rss+xml, application/xml, text/xml",
-                        }), timeout=TIMEOUT)
-                        if r.status_code == 200 and ("<rss" in r.text[:500] or "<feed" in r.text[:500]):
+                        throttle(rss_url)
+                        r = session.get(rss_url, headers=rss_headers, timeout=TIMEOUT)
+                        if r.status_code == 200 and (b"<rss" in r.content[:500] or b"<feed" in r.content[:500]):
                             resp = r
                             break
                     except Exception:
                         continue
 
                 if resp:
-                    root = ET.fromstring(resp.content)
-                    channel = root.find("channel") or root
-                    for item in (channel.findall("item") or [])[:15]:
+                    for item in iter_rss_items(resp, limit=15):
                         title = item.findtext("title", "")
                         link  = item.findtext("link", "")
                         desc  = item.findtext("description", "")
                         if title and link and is_relevant(title, desc):
                             salary = None
-                            m = re.search(r"\$([\d,]+(?:\s*[-–]\s*[\d,]+)?)", title + " " + desc)
+                            m = _USD_AMOUNT_RE.search(title + " " + desc)
                             if m:
                                 salary = f"${m.group(1)}"
-                            jobs.append(make_job(title, "Freelancer Client", link, "Freelancer.com", "Remote (Worldwide)", salary, desc))
+                            jobs.add(title, "Freelancer Client", link, "Freelancer.com", "Remote (Worldwide)", salary, desc)
                 else:
                     # Fallback: web scrape
                     url  = f"https://www.freelancer.com/jobs/{kw}/"
-                    resp = session.get(url, headers=get_headers(), timeout=TIMEOUT)
+                    throttle(url)
+                    resp = get_page(session, url, headers)
                     if resp and resp.status_code == 200:
-                        soup = BeautifulSoup(resp.text, "html.parser")
-                        for card in soup.find_all("div", class_=re.compile(r"JobSearchCard|job-item", re.I))[:10]:
-                            a = card.find("a", href=True)
-                            if not a:
+                        tree = html_tree(resp)
+                        for card in _FREELANCER_CARDS(tree)[:10]:
+                            a = first(_LINK_XP, card)
+                            if a is None:
                                 continue
-                            title = a.get_text(strip=True)
-                            href  = a["href"]
+                            title = node_text(a)
+                            href  = a.get("href")
                             link  = "https://www.freelancer.com" + href if href.startswith("/") else href
-                            desc_el = card.find(class_=re.compile(r"description|summary", re.I))
-                            desc    = desc_el.get_text(strip=True) if desc_el else ""
+                            desc_el = first(_DESCRIPTION_XP, card)
+                            desc    = node_text(desc_el) if desc_el is not None else ""
                             if title and link and is_relevant(title, desc):
-                                jobs.append(make_job(title, "Freelancer Client", link, "Freelancer.com", "Remote (Worldwide)"))
+                                jobs.add(title, "Freelancer Client", link, "Freelancer.com", "Remote (Worldwide)")
 
-                time.sleep(0.5)
             except Exception as e:
                 logger.debug(f"Freelancer.com '{kw}': {e}")
         return jobs
@@ -1138,57 +1652,38 @@ class JobScraper:
     #  15. JOBSDB PH
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_jobsdb(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
         searches = ["call-center", "virtual-assistant", "bpo", "customer-service"]
 
-        for kw in searches:
+        urls = [f"https://ph.jobsdb.com/ph/search-jobs/{kw}/1?sortMode=1" for kw in searches]
+        for kw, resp in zip(searches, fetch_all(urls, {"Referer": "https://ph.jobsdb.com/"})):
+            if resp is None:
+                continue
             try:
-                url  = f"https://ph.jobsdb.com/ph/search-jobs/{kw}/1?sortMode=1"
-                resp = session.get(url, headers=get_headers({"Referer": "https://ph.jobsdb.com/"}), timeout=TIMEOUT)
                 if resp.status_code in (403, 429):
                     continue
-                soup = BeautifulSoup(resp.text, "html.parser")
+                soup = html_soup(resp, SCRIPTS_ONLY)
 
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") == "JobPosting":
-                                title   = item.get("title", "")
-                                company = item.get("hiringOrganization", {}).get("name", "")
-                                link    = item.get("url", "")
-                                sal_data = item.get("baseSalary", {})
-                                salary = None
-                                if isinstance(sal_data, dict):
-                                    val = sal_data.get("value", {})
-                                    if isinstance(val, dict):
-                                        mn = val.get("minValue")
-                                        mx = val.get("maxValue")
-                                        if mn:
-                                            salary = f"PHP {int(mn):,}–{int(mx):,}" if mx else f"PHP {int(mn):,}+"
-                                if title and link:
-                                    jobs.append(make_job(title, company, link, "JobsDB PH", "Philippines", salary))
-                    except Exception:
-                        pass
+                for item in iter_jobpostings(soup):
+                    job = _jobposting_to_record(item, "JobsDB PH")
+                    if job:
+                        jobs.append(job)
 
                 next_data = soup.find("script", id="__NEXT_DATA__")
                 if next_data:
                     try:
-                        data     = json.loads(next_data.string or "{}")
-                        job_list = data.get("props", {}).get("pageProps", {}).get("jobs", [])
+                        data     = orjson.loads(next_data.string or "{}")
+                        job_list = dig(data, "props", "pageProps", "jobs") or []
                         for j in job_list[:15]:
                             title   = j.get("title", "")
-                            company = j.get("advertiser", {}).get("description", "")
+                            company = dig(j, "advertiser", "description", default="")
                             job_id  = j.get("id", "")
                             link    = f"https://ph.jobsdb.com/job/{job_id}" if job_id else ""
                             if title and link:
-                                jobs.append(make_job(title, company, link, "JobsDB PH"))
+                                jobs.add(title, company, link, "JobsDB PH")
                     except Exception:
                         pass
 
-                time.sleep(0.5)
             except Exception as e:
                 logger.debug(f"JobsDB '{kw}': {e}")
         return jobs
@@ -1197,46 +1692,39 @@ class JobScraper:
     #  16. OLX PH JOBS
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_olx(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs    = JobList()
         searches = ["call-center", "bpo", "virtual-assistant", "customer-service", "work-from-home"]
 
-        for kw in searches:
+        urls = [
+            f"https://www.olx.ph/jobs/?search%5Bfilter_str_category%5D=jobs&search%5Bq%5D={kw.replace('-', '+')}&s=newest_first"
+            for kw in searches
+        ]
+        for kw, resp in zip(searches, fetch_all(urls)):
+            if resp is None:
+                continue
             try:
-                url  = f"https://www.olx.ph/jobs/?search%5Bfilter_str_category%5D=jobs&search%5Bq%5D={kw.replace('-', '+')}&s=newest_first"
-                resp = session.get(url, headers=get_headers(), timeout=TIMEOUT)
                 if resp.status_code in (403, 429):
                     continue
-                soup = BeautifulSoup(resp.text, "html.parser")
+                tree = html_tree(resp)
 
-                for script in soup.find_all("script", type="application/ld+json"):
-                    try:
-                        data  = json.loads(script.string or "")
-                        items = data if isinstance(data, list) else [data]
-                        for item in items:
-                            if item.get("@type") in ("JobPosting", "Product"):
-                                title   = item.get("title", "") or item.get("name", "")
-                                link    = item.get("url", "")
-                                company = item.get("hiringOrganization", {}).get("name", "OLX Poster") if item.get("@type") == "JobPosting" else "OLX Poster"
-                                if title and link and is_relevant(title):
-                                    jobs.append(make_job(title, company, link, "OLX PH Jobs"))
-                    except Exception:
-                        pass
+                for item in iter_jobpostings(tree, ("JobPosting", "Product")):
+                    job = _jobposting_to_record(item, "OLX PH Jobs", default_company="OLX Poster")
+                    if job:
+                        jobs.append(job)
 
-                for card in soup.find_all("li", class_=re.compile(r"offer|listing|item", re.I))[:10]:
-                    title_el = card.find(["h3", "h4", "strong"])
-                    if not title_el:
+                for card in _OLX_CARDS(tree)[:10]:
+                    title_el = first(_OLX_TITLE_XP, card)
+                    if title_el is None:
                         continue
-                    title = title_el.get_text(strip=True)
-                    a_el  = card.find("a", href=True)
-                    link  = a_el["href"] if a_el else ""
+                    title = node_text(title_el)
+                    a_el  = first(_LINK_XP, card)
+                    link  = a_el.get("href") if a_el is not None else ""
                     if link and not link.startswith("http"):
                         link = "https://www.olx.ph" + link
-                    sal_el = card.find(class_=re.compile(r"price|salary", re.I))
-                    salary = sal_el.get_text(strip=True) if sal_el else None
+                    sal_el = first(_PRICE_XP, card)
+                    salary = node_text(sal_el) if sal_el is not None else None
                     if title and link and is_relevant(title):
-                        jobs.append(make_job(title, "OLX Poster", link, "OLX PH Jobs", "Philippines", salary))
-                time.sleep(0.5)
+                        jobs.add(title, "OLX Poster", link, "OLX PH Jobs", "Philippines", salary)
             except Exception as e:
                 logger.debug(f"OLX '{kw}': {e}")
         return jobs
@@ -1246,35 +1734,37 @@ class JobScraper:
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_google_jobs(self) -> List[Dict]:
         """Set SERPAPI_KEY in Railway env to enable. Free at serpapi.com"""
-        API_KEY = os.environ.get("SERPAPI_KEY", "")
-        if not API_KEY:
+        if not SERPAPI_KEY:
             return []
 
-        jobs = []
+        jobs     = JobList()
         searches = [
             "call center jobs Philippines",
             "virtual assistant jobs Philippines",
             "BPO jobs Philippines",
             "work from home jobs Philippines",
         ]
-        for q in searches:
+        urls = [
+            "https://serpapi.com/search?" + urlencode({
+                "engine": "google_jobs", "q": q, "location": "Philippines",
+                "api_key": SERPAPI_KEY, "chips": "date_posted:today",
+            })
+            for q in searches
+        ]
+        for q, resp in zip(searches, fetch_all(urls, {"Accept": "application/json"})):
+            if resp is None:
+                continue
             try:
-                resp = requests.get(
-                    "https://serpapi.com/search",
-                    params={"engine": "google_jobs", "q": q, "location": "Philippines", "api_key": API_KEY, "chips": "date_posted:today"},
-                    timeout=TIMEOUT,
-                )
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 for j in data.get("jobs_results", []):
                     title    = j.get("title", "")
                     company  = j.get("company_name", "")
                     location = j.get("location", "Philippines")
-                    link     = j.get("related_links", [{}])[0].get("link", "") or j.get("share_link", "")
-                    sal_data = j.get("detected_extensions", {})
-                    salary   = sal_data.get("salary") if sal_data else None
+                    related  = j.get("related_links")
+                    link     = (dig(related[0], "link") if related else None) or j.get("share_link", "")
+                    salary   = dig(j, "detected_extensions", "salary")
                     if title and link:
-                        jobs.append(make_job(title, company, link, "Google Jobs", location, salary))
-                time.sleep(0.5)
+                        jobs.add(title, company, link, "Google Jobs", location, salary)
             except Exception as e:
                 logger.debug(f"Google Jobs '{q}': {e}")
         return jobs
@@ -1283,55 +1773,53 @@ class JobScraper:
     #  18. TELEGRAM PUBLIC JOB CHANNELS
     # ═══════════════════════════════════════════════════════════════════════════
     def scrape_telegram_channels(self) -> List[Dict]:
-        jobs    = []
-        session = create_session()
+        jobs     = JobList()
         channels = [
             "PHJobHunters", "PHJobVacancy", "jobshiringph",
             "PHJobsOnline", "bpojobsph", "virtualassistantph",
         ]
 
-        for channel in channels:
+        urls = [f"https://t.me/s/{channel}" for channel in channels]
+        for channel, resp in zip(channels, fetch_all(urls, {"Accept": "text/html"})):
+            if resp is None:
+                continue
             try:
-                url  = f"https://t.me/s/{channel}"
-                resp = session.get(url, headers=get_headers({"Accept": "text/html"}), timeout=TIMEOUT)
                 if resp.status_code != 200:
                     continue
-                soup = BeautifulSoup(resp.text, "html.parser")
+                tree = html_tree(resp)
 
-                for msg in soup.find_all("div", class_="tgme_widget_message_text")[:20]:
-                    text = msg.get_text(separator=" ", strip=True)
-                    if not text or len(text) < 30 or not is_relevant(text[:200]):
+                for msg in _TG_MESSAGES(tree)[:20]:
+                    data_post = msg.get("data-post")
+                    text = post_text(_TG_TEXT(msg)[0])
+                    if len(text) < 30 or not is_relevant(text):
                         continue
-                    lines = [l.strip() for l in text.split("\n") if l.strip()]
+                    lines = first_lines(text, 3)
                     title = ""
-                    for line in lines[:3]:
-                        if any(kw.lower() in line.lower() for kw in ["hiring", "looking for", "vacancy", "job", "position", "needed"]):
+                    for line in lines:
+                        if _TITLE_KW_RE.search(line):
                             title = line[:100]
                             break
                     if not title and lines:
                         title = lines[0][:100]
                     if not title:
                         continue
-                    link_el  = msg.find_parent("div", class_="tgme_widget_message")
-                    msg_link = ""
-                    if link_el:
-                        data_post = link_el.get("data-post", "")
-                        if data_post:
-                            msg_link = f"https://t.me/{data_post}"
-                    if not msg_link:
-                        msg_link = f"https://t.me/s/{channel}"
+                    msg_link = f"https://t.me/{data_post}" if data_post else f"https://t.me/s/{channel}"
                     company = ""
-                    m = re.search(r"(?:company|employer|client):\s*(.+?)(?:\n|$)", text, re.I)
+                    m = _COMPANY_RE.search(text)
                     if m:
                         company = m.group(1).strip()[:80]
                     salary = None
-                    m2 = re.search(r"(?:salary|pay|rate|compensation):\s*(.+?)(?:\n|$)", text, re.I)
+                    m2 = _SALARY_RE.search(text)
                     if m2:
                         salary = m2.group(1).strip()[:60]
-                    jobs.append(make_job(title, company or f"@{channel}", msg_link, "Telegram PH Jobs", "Philippines", salary, text[:300]))
+                    jobs.add(title, company or f"@{channel}", msg_link, "Telegram PH Jobs", "Philippines", salary, text[:300])
 
-                time.sleep(0.5)
-            except Exception as e:
+            # Network errors are retried by the session and absorbed by fetch_all;
+            # only an unparseable page is expected here. Anything else (odd
+            # markup) is logged loudly but still skips just this channel.
+            except ET.LxmlError as e:
                 logger.debug(f"Telegram channel '@{channel}': {e}")
+            except Exception:
+                logger.warning(f"⚠️ Telegram channel '@{channel}' skipped", exc_info=True)
 
         return jobs